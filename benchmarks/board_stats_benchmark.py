@@ -0,0 +1,36 @@
+"""Compare the NumPy and pure-Python board statistics backends.
+
+Both backends play perfect memory games on the same board; the benchmark prints
+games per minute for each and the statistics, which should agree within noise.
+
+Usage (with the game installed with NumPy, e.g. `pip install .[analysis]`):
+    python benchmarks/board_stats_benchmark.py [--games 200000] [--python-games 5000] [--width 6] [--height 6]
+"""
+
+import argparse
+import time
+
+from memory_game.simulation.board_stats import board_stats, format_stats
+
+
+def run(backend: str, games: int, width: int, height: int) -> None:
+    start = time.perf_counter()
+    stats = board_stats(width, height, games, backend=backend)
+    elapsed = time.perf_counter() - start
+    print(f"{backend:>6}: {games / elapsed * 60:>13,.0f} games/min  {format_stats(stats)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Board statistics backend benchmark")
+    parser.add_argument("--games", type=int, default=200_000, help="Games for NumPy")
+    parser.add_argument("--python-games", type=int, default=5_000, help="Games for pure Python")
+    parser.add_argument("--width", type=int, default=6)
+    parser.add_argument("--height", type=int, default=6)
+    args = parser.parse_args()
+
+    run("numpy", args.games, args.width, args.height)
+    run("python", args.python_games, args.width, args.height)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare the card renderers by bytes written to the terminal and drawing time.
+
+For every renderer and card size reported:
+- draw time: scaling and drawing all card images once, as on a cold image cache,
+- card: bytes a true color terminal receives to draw one face up card,
+- board: bytes of a full repaint of a face up 6x6 board, the worst case frame,
+- link: time that repaint takes on a link of --bandwidth kbit/s.
+
+Textual only repaints what changed, so a flip writes about two cards, not the board.
+Run the game with `--profile` to see the bytes of the real frames in the overlay.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/card_renderer_benchmark.py [--bandwidth 1000]
+"""
+
+import argparse
+import time
+
+from rich.table import Table
+
+from memory_game.gameplay.card_renderers import RENDERERS, frame_bytes
+from memory_game.gameplay.cards import CARD_GUTTER, CARD_SIZES
+from memory_game.gameplay.image_cache import CARD_IMAGES, DEFAULT_IMAGE, image_cache
+
+BOARD_WIDTH = 6
+BOARD_HEIGHT = 6
+
+
+def board(card_size: tuple[int, int]) -> Table:
+    """Face up cards laid out like CardGrid, two of each symbol."""
+    table = Table.grid(padding=(0, CARD_GUTTER[0], CARD_GUTTER[1], 0))
+    for _ in range(BOARD_WIDTH):
+        table.add_column(width=card_size[0])
+    symbols = [image for image in CARD_IMAGES for _ in range(2)]
+    for row in range(BOARD_HEIGHT):
+        table.add_row(
+            *(
+                image_cache.get(symbols[row * BOARD_WIDTH + column], card_size)
+                for column in range(BOARD_WIDTH)
+            )
+        )
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Card renderer benchmark")
+    parser.add_argument(
+        "--bandwidth", type=float, default=1000, help="Link speed in kbit/s (default: 1000)"
+    )
+    args = parser.parse_args()
+
+    print(f"{BOARD_WIDTH}x{BOARD_HEIGHT} board, link time at {args.bandwidth:g} kbit/s")
+    print(
+        f"{'renderer':<10} {'card':>6} {'draw ms':>8} {'card B':>8} {'board B':>9} {'link ms':>8}"
+    )
+    for name in RENDERERS:
+        image_cache.set_renderer(name)
+        for card_size in CARD_SIZES:
+            start = time.perf_counter()
+            for image_name in [DEFAULT_IMAGE, *CARD_IMAGES]:
+                image_cache.get(image_name, card_size)
+            draw_ms = (time.perf_counter() - start) * 1000
+
+            card = frame_bytes(image_cache.get(CARD_IMAGES[0], card_size), card_size[0])
+            board_width = BOARD_WIDTH * card_size[0] + (BOARD_WIDTH - 1) * CARD_GUTTER[0]
+            board_bytes = frame_bytes(board(card_size), board_width)
+            link_ms = board_bytes * 8 / args.bandwidth
+            print(
+                f"{name:<10} {card_size[0]:>3}x{card_size[1]:<2} {draw_ms:8.2f} "
+                f"{card:8,} {board_bytes:9,} {link_ms:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measure headless game engine throughput in moves (card flips) per second.
+
+Players flip random face-down cards until every pair is found.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/engine_benchmark.py [--games 2000] [--width 6] [--height 6]
+"""
+
+import argparse
+import time
+from random import Random
+
+from memory_game.engine.game_engine import GameEngine
+
+
+def play_random_game(engine: GameEngine, rng: Random) -> int:
+    """Play until the game is over, returning the number of flips made."""
+    moves = 0
+    hidden = list(range(len(engine.symbols)))
+    while not engine.is_over:
+        first, second = rng.sample(hidden, 2)
+        engine.flip(first)
+        engine.flip(second)
+        moves += 2
+        if engine.awaiting_resolve:
+            engine.resolve()
+        else:
+            hidden.remove(first)
+            hidden.remove(second)
+    return moves
+
+
+def run(games: int, width: int, height: int) -> None:
+    rng = Random(0)
+    engines = [GameEngine.new_game(width, height, rng) for _ in range(games)]
+
+    start = time.perf_counter()
+    moves = sum(play_random_game(engine, rng) for engine in engines)
+    elapsed = time.perf_counter() - start
+
+    print(f"Board {width}x{height}, {games} games, {moves} moves")
+    print(f"  {moves / elapsed:12.0f} moves/s")
+    print(f"  {games / elapsed:12.0f} games/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless game engine benchmark")
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--width", type=int, default=6)
+    parser.add_argument("--height", type=int, default=6)
+    args = parser.parse_args()
+    run(args.games, args.width, args.height)
@@ -0,0 +1,103 @@
+"""Measure card flips per second on a 6x6 board.
+
+Compares the current Card, which toggles a reactive face, with the previous
+implementation that removed and mounted an image widget on every flip.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/flip_benchmark.py [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import time
+
+from rich.console import RenderableType
+from textual.app import App, ComposeResult
+from textual.widget import Widget
+
+from memory_game.gameplay.cards import Card, CardGrid
+from memory_game.gameplay.image_cache import CARD_IMAGES, DEFAULT_IMAGE, image_cache
+
+BOARD_WIDTH = 6
+BOARD_HEIGHT = 6
+
+
+class LegacyImageWidget(Widget):
+    """Single image widget, as mounted by the old Card.flip."""
+
+    DEFAULT_CSS = "LegacyImageWidget { width: auto; height: auto; }"
+
+    def __init__(self, image_name: str) -> None:
+        super().__init__()
+        self.image_name = image_name
+
+    def render(self) -> RenderableType:
+        return image_cache.get(self.image_name)
+
+
+class LegacyCard(Card):
+    """Card flipping by removing and mounting image widgets."""
+
+    def compose(self) -> ComposeResult:
+        yield LegacyImageWidget(DEFAULT_IMAGE)
+
+    def flip(self):
+        self.is_flipped = not self.is_flipped
+        images = self.query("LegacyImageWidget")
+        if images:
+            images.last().remove()
+        if self.is_flipped:
+            self.mount(LegacyImageWidget(self.symbol))
+        else:
+            self.mount(LegacyImageWidget(DEFAULT_IMAGE))
+
+
+class LegacyCardGrid(CardGrid):
+    def __init__(self, width: int, height: int, symbols: list[str]) -> None:
+        super().__init__(width, height, symbols)
+        self.cards = [LegacyCard(card.symbol, card.position, classes="card") for card in self.cards]
+
+
+class FlipBenchmarkApp(App):
+    CSS = "Card { border: none; max-width: 12; max-height: 6; }"
+
+    def __init__(self, grid_class: type[CardGrid]) -> None:
+        super().__init__()
+        self.grid_class = grid_class
+
+    def compose(self) -> ComposeResult:
+        symbols = (CARD_IMAGES * 2)[: BOARD_WIDTH * BOARD_HEIGHT]
+        yield self.grid_class(BOARD_WIDTH, BOARD_HEIGHT, symbols)
+
+
+async def flips_per_second(grid_class: type[CardGrid], rounds: int) -> float:
+    """Flip every card `rounds` times, letting the app settle after each sweep."""
+    app = FlipBenchmarkApp(grid_class)
+    async with app.run_test(size=(200, 80)) as pilot:
+        await pilot.pause()
+        cards = list(app.query(Card))
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for card in cards:
+                card.flip()
+            await pilot.pause()
+        elapsed = time.perf_counter() - start
+
+    return rounds * len(cards) / elapsed
+
+
+async def run(rounds: int) -> None:
+    image_cache.warm()
+    before = await flips_per_second(LegacyCardGrid, rounds)
+    after = await flips_per_second(CardGrid, rounds)
+    print(f"Board {BOARD_WIDTH}x{BOARD_HEIGHT}, {rounds} rounds")
+    print(f"  remove/mount flip: {before:10.0f} flips/s")
+    print(f"  reactive flip:     {after:10.0f} flips/s")
+    print(f"  speedup:           {after / before:10.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Card flip benchmark")
+    parser.add_argument("--rounds", type=int, default=20)
+    asyncio.run(run(parser.parse_args().rounds))
@@ -0,0 +1,297 @@
+"""Benchmark the hot paths of the app and store the results as JSON.
+
+Drives MemoryApp headlessly with `App.run_test()` and measures:
+- time until GameplayScreen is first painted,
+- composing and mounting the board at every size of the config prompt,
+- dealing a rematch on the board of the previous game,
+- latency of card presses (flip, match check) and of the "Next player" button,
+- GameSaveManager.save_game / load_game throughput.
+
+Results are written to a JSON file together with the git commit, and can be
+compared with the results of another commit.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/hot_paths_benchmark.py [--output results.json] [--compare baseline.json]
+        [--max-size 20] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from textual.widgets import Button
+
+from memory_game.app import MemoryApp
+from memory_game.engine.game_engine import MIN_BOARD_SIZE, deal_cards, symbol_name
+from memory_game.game_saver.game_save_manager import (
+    BoardState,
+    CardsState,
+    GameSaveManager,
+    GameState,
+    PlayersState,
+)
+from memory_game.gameplay.cards import Card
+from memory_game.gameplay.gameplay_screen import GameplayScreen
+
+SCREEN_SIZE = (200, 80)
+FLIP_BOARD = (6, 6)
+SAVE_BOARDS = [(6, 6), (20, 20)]
+REMATCH_BOARDS = [(6, 6), (20, 20)]
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    """Median, 95th percentile and best time, in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))] * 1000,
+        "min_ms": ordered[0] * 1000,
+        "samples": len(ordered),
+    }
+
+
+def benchmark_config(save_dir: str) -> dict[str, str]:
+    return {
+        "width": "6",
+        "height": "6",
+        "game_save_file": str(Path(save_dir, "game_save.dat")),
+        "key_save_file": str(Path(save_dir, "save.key")),
+        "save_slots_dir": str(Path(save_dir, "saves")),
+        "record_replay": "false",
+        "record_stats": "false",
+        "stats_file": str(Path(save_dir, "stats.db")),
+    }
+
+
+async def first_paint(config: dict[str, str], repeat: int) -> dict[str, float]:
+    """Time from starting the app until GameplayScreen has been painted."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app = MemoryApp(config)
+        async with app.run_test(size=SCREEN_SIZE) as pilot:
+            while not any(isinstance(screen, GameplayScreen) for screen in app.screen_stack):
+                await pilot.pause()
+            await pilot.pause()
+            samples.append(time.perf_counter() - start)
+    return summary(samples)
+
+
+async def board_mounts(
+    config: dict[str, str], max_size: int, repeat: int
+) -> dict[str, dict[str, float]]:
+    """Compose and mount the board of every size until it is painted."""
+    results = {}
+    app = MemoryApp(config)
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await pilot.pause()
+        await pilot.click("#submit_button")
+        await pilot.pause()
+        screen = app.screen
+        assert isinstance(screen, GameplayScreen)
+
+        for width in range(MIN_BOARD_SIZE, max_size + 1):
+            for height in range(MIN_BOARD_SIZE, max_size + 1):
+                if (width * height) % 2:
+                    continue
+                samples = []
+                for _ in range(repeat):
+                    screen.clear_board()
+                    await pilot.pause()
+                    start = time.perf_counter()
+                    screen.update_board_size(width, height)
+                    screen.mount_grid()
+                    await pilot.pause()
+                    samples.append(time.perf_counter() - start)
+                results[f"{width}x{height}"] = summary(samples)
+    return results
+
+
+async def rematches(config: dict[str, str], repeat: int) -> dict[str, dict[str, float]]:
+    """Deal a new game on the board of the previous one, reusing its cards."""
+    results = {}
+    app = MemoryApp(config)
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await pilot.pause()
+        await pilot.click("#submit_button")
+        await pilot.pause()
+        screen = app.screen
+        assert isinstance(screen, GameplayScreen)
+
+        for width, height in REMATCH_BOARDS:
+            screen.update_board_size(width, height)
+            screen.mount_grid()
+            await pilot.pause()
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                screen.action_rematch()
+                await pilot.pause()
+                samples.append(time.perf_counter() - start)
+            results[f"{width}x{height}"] = summary(samples)
+    return results
+
+
+async def flip_latency(config: dict[str, str], repeat: int) -> dict[str, dict[str, float]]:
+    """Latency of pressing a card and the "Next player" button, until the app is idle."""
+    first_flips, matches, misses, next_turns = [], [], [], []
+    app = MemoryApp(config)
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await pilot.pause()
+        await pilot.click("#submit_button")
+        await pilot.pause()
+        screen = app.screen
+        assert isinstance(screen, GameplayScreen)
+
+        async def press(card: Card, samples: list[float]) -> None:
+            start = time.perf_counter()
+            card.press()
+            await pilot.pause()
+            samples.append(time.perf_counter() - start)
+
+        for _ in range(repeat):
+            screen.clear_board()
+            screen.update_board_size(*FLIP_BOARD)
+            screen.mount_grid()
+            await pilot.pause()
+            engine = screen.engine
+            cards = list(screen.query(Card))
+
+            # miss with two different symbols, then match every pair
+            first = 0
+            second = next(i for i, s in enumerate(engine.symbols) if s != engine.symbols[first])
+            await press(cards[first], first_flips)
+            await press(cards[second], misses)
+            start = time.perf_counter()
+            screen.query_one("#next-button", Button).press()
+            await pilot.pause()
+            next_turns.append(time.perf_counter() - start)
+
+            positions: dict[int, list[int]] = {}
+            for position, symbol in enumerate(engine.symbols):
+                positions.setdefault(symbol, []).append(position)
+            for a, b in positions.values():
+                await press(cards[a], first_flips)
+                await press(cards[b], matches)
+            # dismiss the game over screen
+            if app.screen is not screen:
+                app.pop_screen()
+                await pilot.pause()
+
+    return {
+        "first_card": summary(first_flips),
+        "second_card_match": summary(matches),
+        "second_card_miss": summary(misses),
+        "next_player": summary(next_turns),
+    }
+
+
+def game_state(width: int, height: int) -> GameState:
+    symbols = [symbol_name(symbol) for symbol in deal_cards(width, height)]
+    return GameState(
+        board=BoardState(width=width, height=height),
+        players=PlayersState(scores=[3, 2], current_player=2),
+        cards=CardsState(
+            all_cards=symbols, matched_cards=[False] * len(symbols)
+        ),
+        turns=12,
+    )
+
+
+def save_throughput(save_dir: str, repeat: int) -> dict[str, dict[str, float]]:
+    """Saves and loads per second, each one encrypted and written atomically."""
+    results = {}
+    manager = GameSaveManager(str(Path(save_dir, "throughput.dat")), str(Path(save_dir, "t.key")))
+    rounds = repeat * 20
+    for width, height in SAVE_BOARDS:
+        state = game_state(width, height)
+        manager.save_game(state)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            manager.save_game(state)
+        saves = rounds / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            manager.load_game()
+        loads = rounds / (time.perf_counter() - start)
+        results[f"{width}x{height}"] = {"saves_per_s": saves, "loads_per_s": loads}
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    values = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            values.update(flatten(value, f"{name}."))
+        elif key != "samples":
+            values[name] = value
+    return values
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print the change of every metric against the baseline results."""
+    print(f"Compared with {baseline.get('commit')}:")
+    before = flatten(baseline["results"])
+    for name, value in flatten(results["results"]).items():
+        if before.get(name):
+            change = (value - before[name]) / before[name]
+            print(f"  {name:<45} {before[name]:>10.2f} -> {value:>10.2f} ({change:+.1%})")
+
+
+async def run(max_size: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as save_dir:
+        config = benchmark_config(save_dir)
+        return {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "results": {
+                "first_paint": await first_paint(config, repeat),
+                "board_mount": await board_mounts(config, max_size, repeat),
+                "rematch": await rematches(config, repeat),
+                "flip_latency": await flip_latency(config, repeat),
+                "save_load": save_throughput(save_dir, repeat),
+            },
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hot path benchmark")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file")
+    parser.add_argument("--compare", help="JSON results of another commit to compare with")
+    parser.add_argument("--max-size", type=int, default=20, help="Largest board width/height")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per measurement")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.max_size, args.repeat))
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for name, value in flatten(results["results"]).items():
+        print(f"  {name:<45} {value:>10.2f}")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure mount time and memory of card grids as the board grows.
+
+Every case runs in a fresh process, so the reported RSS growth belongs to that
+grid only. The 20x20 cases mount 400 cards.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/large_board_benchmark.py
+"""
+
+import asyncio
+import multiprocessing
+import resource
+import sys
+import time
+
+from textual.app import App, ComposeResult
+
+from memory_game.engine.game_engine import deal_cards, symbol_name
+from memory_game.gameplay.cards import CardGrid
+from memory_game.gameplay.image_cache import image_cache
+from memory_game.gameplay.virtual_card_grid import VirtualCardGrid
+
+CASES = [
+    ("CardGrid", 6, 6),
+    ("CardGrid", 20, 20),
+    ("VirtualCardGrid", 6, 6),
+    ("VirtualCardGrid", 10, 10),
+    ("VirtualCardGrid", 20, 20),
+]
+GRID_CLASSES = {"CardGrid": CardGrid, "VirtualCardGrid": VirtualCardGrid}
+
+
+def rss_kib() -> int:
+    """Current resident set size, falling back to the peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class EmptyApp(App):
+    CSS = "VirtualCardGrid { height: 1fr; }"
+
+    def compose(self) -> ComposeResult:
+        return iter(())
+
+
+async def mount_grid(grid_name: str, width: int, height: int) -> tuple[float, int]:
+    symbols = [symbol_name(symbol) for symbol in deal_cards(width, height)]
+    image_cache.warm()
+    app = EmptyApp()
+    async with app.run_test(size=(160, 60)) as pilot:
+        await pilot.pause()
+        rss_before = rss_kib()
+
+        start = time.perf_counter()
+        await app.mount(GRID_CLASSES[grid_name](width, height, symbols))
+        await pilot.pause()
+        elapsed = time.perf_counter() - start
+
+        return elapsed, rss_kib() - rss_before
+
+
+def run_case(case: tuple[str, int, int]) -> tuple[float, int]:
+    return asyncio.run(mount_grid(*case))
+
+
+if __name__ == "__main__":
+    context = multiprocessing.get_context("spawn")
+    print(f"{'grid':<16} {'board':>6} {'cards':>6} {'mount ms':>10} {'RSS KiB':>10}")
+    for case in CASES:
+        with context.Pool(1) as pool:
+            elapsed, rss = pool.apply(run_case, (case,))
+        grid_name, width, height = case
+        print(
+            f"{grid_name:<16} {width:>3}x{height:<2} {width * height:>6}"
+            f" {elapsed * 1000:>10.1f} {rss:>10}"
+        )
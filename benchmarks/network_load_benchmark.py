@@ -0,0 +1,190 @@
+"""Load test the game server with many simulated clients.
+
+Starts `memory-game serve` in a subprocess, listening on a Unix socket (or on
+localhost with --tcp), and opens --rooms rooms with --players clients each. Every
+client plays random valid moves, one flip every --interval seconds on its turn,
+until all games are over. Reported:
+- flip round trip: from sending a flip until the server's CardFlipped event arrives,
+- server CPU time, read from the server's stats message,
+- rooms per core: rooms one fully busy core could host at the same move rate.
+
+The clients run in this process on the same machine, so keep an eye on the
+machine's load when comparing runs with many rooms.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/network_load_benchmark.py [--rooms 500] [--players 2] [--width 4]
+        [--height 4] [--interval 0.05] [--tcp]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from random import Random
+
+from memory_game.engine.game_engine import CardFlipped, PairMissed
+from memory_game.network.client import GameClient
+from memory_game.network.protocol import DEFAULT_HOST, UNIX_PREFIX
+
+# connections opened at the same time, below the listen backlog of the server
+CONNECT_CONCURRENCY = 64
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def raise_open_files_limit(connections: int) -> None:
+    """Every client and its server side need a file descriptor."""
+    try:
+        import resource
+    except ImportError:
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = connections + 100
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((DEFAULT_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def start_server(address: str) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "memory_game.network.server", "--address", address],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    # the server prints one line once it accepts connections
+    if not server.stdout or not server.stdout.readline():
+        raise RuntimeError("Game server did not start")
+    return server
+
+
+async def server_stats(address: str) -> dict:
+    client = await GameClient.connect(address)
+    try:
+        return await client.request({"type": "stats"}, "stats")
+    finally:
+        await client.close()
+
+
+async def play(
+    address: str,
+    room: str,
+    args: argparse.Namespace,
+    rng: Random,
+    connecting: asyncio.Semaphore,
+    latencies: list[float],
+) -> None:
+    """Play one seat of the room with random moves until the game is over."""
+    async with connecting:
+        client = await GameClient.connect(address)
+        engine = await client.join(room, args.width, args.height, args.players)
+
+    sent: dict[int, float] = {}
+    cards = range(len(engine.symbols))
+    try:
+        while not engine.is_over and (message := await client.receive()) is not None:
+            if message["type"] == "error":
+                raise RuntimeError(f"Room {room}: {message['message']}")
+
+            event = engine.apply(message)
+            if isinstance(event, CardFlipped) and event.position in sent:
+                latencies.append(time.perf_counter() - sent.pop(event.position))
+            elif isinstance(event, PairMissed) and event.player == engine.seat:
+                engine.resolve()
+
+            if (
+                not sent
+                and not engine.is_over
+                and engine.started
+                and engine.current_player == engine.seat
+                and len(engine.flipped) < 2
+            ):
+                await asyncio.sleep(args.interval)
+                position = rng.choice([card for card in cards if engine.can_flip(card)])
+                sent[position] = time.perf_counter()
+                engine.flip(position)
+    finally:
+        await client.close()
+
+
+async def run_clients(address: str, args: argparse.Namespace) -> tuple[list[float], float]:
+    connecting = asyncio.Semaphore(CONNECT_CONCURRENCY)
+    latencies: list[float] = []
+    rng = Random(args.seed)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            play(address, f"room-{room}", args, Random(rng.getrandbits(64)), connecting, latencies)
+            for room in range(args.rooms)
+            for _ in range(args.players)
+        )
+    )
+    return latencies, time.perf_counter() - start
+
+
+async def load_test(address: str, args: argparse.Namespace) -> None:
+    before = await server_stats(address)
+    latencies, elapsed = await run_clients(address, args)
+    after = await server_stats(address)
+
+    cpu_time = after["cpu_time"] - before["cpu_time"]
+    flips = after["moves"] - before["moves"]
+    ordered = sorted(latencies)
+    print(
+        f"Rooms: {args.rooms} x {args.players} players, {args.width}x{args.height} board, "
+        f"a flip every {args.interval * 1000:.0f} ms on each turn"
+    )
+    print(f"Flips: {flips} in {elapsed:.2f} s ({flips / elapsed:.0f} flips/s)")
+    print(
+        f"Flip round trip: p50 {statistics.median(ordered) * 1000:.2f} ms, "
+        f"p95 {percentile(ordered, 0.95) * 1000:.2f} ms, "
+        f"p99 {percentile(ordered, 0.99) * 1000:.2f} ms, max {ordered[-1] * 1000:.2f} ms"
+    )
+    print(
+        f"Server CPU: {cpu_time:.2f} s ({cpu_time / elapsed:.0%} of one core), "
+        f"{cpu_time / flips * 1e6:.0f} us per flip"
+    )
+    print(f"Rooms per core at this move rate: {args.rooms * elapsed / cpu_time:.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Game server load benchmark")
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--height", type=int, default=4)
+    parser.add_argument(
+        "--interval", type=float, default=0.05, help="Seconds between flips of a player"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--tcp", action="store_true", help="Use localhost TCP, not a Unix socket")
+    args = parser.parse_args()
+
+    raise_open_files_limit(2 * args.rooms * args.players)
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.tcp:
+            address = f"{DEFAULT_HOST}:{free_port()}"
+        else:
+            address = f"{UNIX_PREFIX}{os.path.join(tmp, 'server.sock')}"
+        server = start_server(address)
+        try:
+            asyncio.run(load_test(address, args))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
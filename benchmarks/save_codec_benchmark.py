@@ -0,0 +1,49 @@
+"""Compare the save codec chains: saved size and encode/decode time.
+
+Every combination of serializer, compression and cipher encodes a half played game
+in memory, without the file write, which costs the same for every chain.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/save_codec_benchmark.py [--repeat 2000]
+"""
+
+import argparse
+import itertools
+import os
+import tempfile
+import timeit
+from random import Random
+
+from memory_game.game_saver.game_save_manager import GameSaveManager
+from memory_game.game_saver.save_codec import CIPHERS, COMPRESSIONS, SERIALIZERS, SaveCodec
+
+from save_format_benchmark import half_played_state
+
+BOARD_SIZES = [(6, 6), (20, 20)]
+
+
+def run(repeat: int) -> None:
+    rng = Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        key_file = os.path.join(tmp, "save.key")
+        print(f"{'board':>6} {'chain':<20} {'saved B':>8} {'encode us':>10} {'decode us':>10}")
+        for width, height in BOARD_SIZES:
+            state = half_played_state(width, height, rng)
+            for chain in itertools.product(SERIALIZERS, COMPRESSIONS, CIPHERS):
+                codec = SaveCodec(*chain)
+                manager = GameSaveManager(os.path.join(tmp, "save.dat"), key_file, codec)
+                data = manager.encode(state)
+                assert manager.decode(data) == state
+
+                encode_time = timeit.timeit(lambda: manager.encode(state), number=repeat) / repeat
+                decode_time = timeit.timeit(lambda: manager.decode(data), number=repeat) / repeat
+                print(
+                    f"{width:>3}x{height:<2} {codec.name:<20} {len(data):>8}"
+                    f" {encode_time * 1e6:>10.1f} {decode_time * 1e6:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save codec benchmark")
+    parser.add_argument("--repeat", type=int, default=2000)
+    run(parser.parse_args().repeat)
@@ -0,0 +1,72 @@
+"""Compare the JSON and binary save formats: size and encode/decode time.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/save_format_benchmark.py [--repeat 2000]
+"""
+
+import argparse
+import json
+import timeit
+from dataclasses import asdict
+from random import Random
+
+from cryptography.fernet import Fernet
+
+from memory_game.engine.game_engine import deal_cards, symbol_name
+from memory_game.game_saver.game_save_manager import (
+    BoardState,
+    CardsState,
+    GameState,
+    PlayersState,
+)
+
+BOARD_SIZES = [(2, 3), (6, 6), (20, 20)]
+
+
+def half_played_state(width: int, height: int, rng: Random) -> GameState:
+    cards = [symbol_name(symbol) for symbol in deal_cards(width, height, rng)]
+    return GameState(
+        board=BoardState(width=width, height=height),
+        players=PlayersState(scores=[width * height // 8] * 2, current_player=2),
+        cards=CardsState(
+            all_cards=cards,
+            matched_cards=[rng.random() < 0.5 for _ in cards],
+        ),
+        turns=width * height,
+    )
+
+
+def run(repeat: int) -> None:
+    rng = Random(0)
+    fernet = Fernet(Fernet.generate_key())
+    print(
+        f"{'board':>6} {'format':>7} {'raw B':>7} {'saved B':>8}"
+        f" {'encode us':>10} {'decode us':>10}"
+    )
+    for width, height in BOARD_SIZES:
+        state = half_played_state(width, height, rng)
+        json_data = json.dumps(asdict(state)).encode()
+        binary_data = state.to_bytes()
+        assert GameState.decode(binary_data) == GameState.decode(json_data) == state
+
+        cases = {
+            "json": (
+                lambda: json.dumps(asdict(state)).encode(),
+                lambda: GameState.from_dict(json.loads(json_data)),
+                json_data,
+            ),
+            "binary": (state.to_bytes, lambda: GameState.from_bytes(binary_data), binary_data),
+        }
+        for name, (encode, decode, data) in cases.items():
+            encode_time = timeit.timeit(encode, number=repeat) / repeat
+            decode_time = timeit.timeit(decode, number=repeat) / repeat
+            print(
+                f"{width:>3}x{height:<2} {name:>7} {len(data):>7} {len(fernet.encrypt(data)):>8}"
+                f" {encode_time * 1e6:>10.1f} {decode_time * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save format benchmark")
+    parser.add_argument("--repeat", type=int, default=2000)
+    run(parser.parse_args().repeat)
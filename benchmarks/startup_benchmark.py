@@ -0,0 +1,76 @@
+"""Measure cold startup: imports and time until the board size prompt is interactive.
+
+Every sample starts a fresh interpreter, so nothing is cached in sys.modules.
+Reports the wall time of the whole process, the time spent importing
+memory_game.app, and the time from the start of the interpreter until the
+config prompt is shown and idle in a headless app.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/startup_benchmark.py [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+CHILD = """
+import asyncio, json, time
+start = time.perf_counter()
+from memory_game.app import MemoryApp
+from memory_game.config_prompt.config_prompt_screen import ConfigPromptScreen
+imported = time.perf_counter()
+
+async def main():
+    app = MemoryApp({"record_replay": "false"})
+    async with app.run_test() as pilot:
+        while not isinstance(app.screen, ConfigPromptScreen):
+            await pilot.pause()
+        await pilot.pause()
+        interactive = time.perf_counter()
+        modules = sorted(
+            name for name in __import__("sys").modules
+            if name.split(".")[0] in ("cryptography", "PIL", "pyfiglet", "rich_pixels")
+        )
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000,
+        "interactive_ms": (interactive - start) * 1000,
+        "deferred_loaded": sorted({name.split(".")[0] for name in modules}),
+    }))
+
+asyncio.run(main())
+"""
+
+
+def run_child() -> tuple[float, dict]:
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], capture_output=True, text=True, check=True
+    ).stdout
+    return (time.perf_counter() - start) * 1000, json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    run_child()  # warm the OS file cache
+    process, imports, interactive = [], [], []
+    for _ in range(args.runs):
+        wall, result = run_child()
+        process.append(wall)
+        imports.append(result["import_ms"])
+        interactive.append(result["interactive_ms"])
+
+    print(f"Startup over {args.runs} runs (median):")
+    print(f"  process wall time:        {statistics.median(process):8.1f} ms")
+    print(f"  import memory_game.app:   {statistics.median(imports):8.1f} ms")
+    print(f"  time to interactive:      {statistics.median(interactive):8.1f} ms")
+    print(f"  heavy modules loaded by then: {', '.join(result['deferred_loaded']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
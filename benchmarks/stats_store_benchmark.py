@@ -0,0 +1,99 @@
+"""Measure the stats store with many recorded games.
+
+Queues --games random results through StatsStore.record, as the game does, and
+reports the write throughput of the batching background thread. Then it times the
+queries of the leaderboard screen against the same aggregates computed by scanning
+the games table.
+
+Usage (with the game installed, e.g. `pip install .`):
+    python benchmarks/stats_store_benchmark.py [--games 300000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from random import Random
+
+from memory_game.stats.stats_store import GameResult, StatsStore
+
+BOARD_SIZES = [(2, 3), (4, 4), (6, 6), (10, 10), (20, 20)]
+PLAYER_TYPES = ["human", "easy", "medium", "hard"]
+
+
+def random_result(rng: Random) -> GameResult:
+    width, height = rng.choice(BOARD_SIZES)
+    pairs = width * height // 2
+    first = rng.randint(0, pairs)
+    scores = [first, pairs - first]
+    winner = None if first * 2 == pairs else (1 if first * 2 > pairs else 2)
+    return GameResult(
+        width=width,
+        height=height,
+        scores=scores,
+        turns=rng.randint(pairs, pairs * 4),
+        duration=rng.uniform(pairs * 2, pairs * 10),
+        winner=winner,
+        player_types=[rng.choice(PLAYER_TYPES) for _ in scores],
+        finished_at=time.time() - rng.uniform(0, 365 * 86400),
+    )
+
+
+def timed(function, repeat: int = 20) -> float:
+    """Median milliseconds of the calls."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2] * 1000
+
+
+def scan_totals(stats_file: str) -> list[tuple]:
+    connection = sqlite3.connect(stats_file)
+    try:
+        return connection.execute(
+            "SELECT width, height, count(*), sum(winner IS NULL), avg(turns), min(turns),"
+            " avg(duration), min(duration) FROM games GROUP BY width, height"
+        ).fetchall()
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stats store benchmark")
+    parser.add_argument("--games", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = Random(args.seed)
+    results = [random_result(rng) for _ in range(args.games)]
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.db")
+        store = StatsStore(stats_file)
+
+        start = time.perf_counter()
+        for result in results:
+            store.record(result)
+        queued = time.perf_counter() - start
+        store.close()
+        written = time.perf_counter() - start
+        print(
+            f"Recorded {args.games} games: {queued / args.games * 1e6:.2f} us per record call, "
+            f"all written in {written:.2f} s ({args.games / written:,.0f} games/s)"
+        )
+
+        width, height = BOARD_SIZES[2]
+        queries = [
+            ("board totals", timed(store.board_totals)),
+            (f"best {width}x{height} games", timed(lambda: store.leaderboard(width, height))),
+            ("board totals, scanning games", timed(lambda: scan_totals(stats_file), 3)),
+        ]
+        for name, milliseconds in queries:
+            print(f"{name:<30} {milliseconds:8.2f} ms")
+        print(f"Database size: {os.path.getsize(stats_file) / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
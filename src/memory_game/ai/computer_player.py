@@ -0,0 +1,129 @@
+import logging
+from collections import OrderedDict
+from random import Random
+
+from memory_game.engine.game_engine import CardFlipped, GameEngine, GameEvent, PairMatched
+
+logger = logging.getLogger(__name__)
+
+# number of cards a computer player remembers, None is perfect recall
+DIFFICULTIES: dict[str, int | None] = {
+    "easy": 4,
+    "medium": 10,
+    "hard": None,
+}
+
+
+class PositionPool:
+    """Set of card positions with constant time add, discard and random choice."""
+
+    def __init__(self, positions: range) -> None:
+        self.items = list(positions)
+        self.indexes = {position: index for index, position in enumerate(self.items)}
+
+    def __contains__(self, position: int) -> bool:
+        return position in self.indexes
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, position: int) -> None:
+        if position not in self.indexes:
+            self.indexes[position] = len(self.items)
+            self.items.append(position)
+
+    def discard(self, position: int) -> None:
+        index = self.indexes.pop(position, None)
+        if index is None:
+            return
+        last = self.items.pop()
+        if last != position:
+            self.items[index] = last
+            self.indexes[last] = index
+
+    def choice(self, rng: Random) -> int:
+        return self.items[rng.randrange(len(self.items))]
+
+
+class ComputerPlayer:
+    """Computer player choosing cards from what it remembers.
+
+    Knowledge is updated from engine events as cards are revealed, never by scanning
+    the board: remembered cards by position and by symbol, symbols whose both cards
+    are remembered, and cards it knows nothing about. With a bounded memory the
+    oldest remembered card is forgotten first.
+    """
+
+    def __init__(self, engine: GameEngine, rng: Random, memory_size: int | None = None) -> None:
+        self.engine = engine
+        self.rng = rng
+        self.memory_size = memory_size
+        self.memory: OrderedDict[int, int] = OrderedDict()  # position -> symbol
+        self.positions: dict[int, set[int]] = {}  # symbol -> remembered positions
+        self.known_pairs: set[int] = set()
+        self.unmatched = PositionPool(range(len(engine.symbols)))
+        self.unknown = PositionPool(range(len(engine.symbols)))
+        for position, matched in enumerate(engine.matched):
+            if matched:
+                self.unmatched.discard(position)
+                self.unknown.discard(position)
+        engine.subscribe(self.on_game_event)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        if isinstance(event, CardFlipped):
+            self.remember(event.position, event.symbol)
+        elif isinstance(event, PairMatched):
+            for position in (event.first, event.second):
+                self.forget(position)
+                self.unmatched.discard(position)
+                self.unknown.discard(position)
+
+    def remember(self, position: int, symbol: int) -> None:
+        if position in self.memory:
+            self.memory.move_to_end(position)
+            return
+
+        self.memory[position] = symbol
+        self.unknown.discard(position)
+        positions = self.positions.setdefault(symbol, set())
+        positions.add(position)
+        if len(positions) == 2:
+            self.known_pairs.add(symbol)
+
+        if self.memory_size is not None and len(self.memory) > self.memory_size:
+            oldest = next(iter(self.memory))
+            self.forget(oldest)
+            self.unknown.add(oldest)
+
+    def forget(self, position: int) -> None:
+        symbol = self.memory.pop(position, None)
+        if symbol is None:
+            return
+        positions = self.positions[symbol]
+        positions.discard(position)
+        self.known_pairs.discard(symbol)
+        if not positions:
+            del self.positions[symbol]
+
+    def choose_card(self) -> int:
+        """Position of the next card to flip."""
+        flipped = self.engine.flipped
+        if not flipped:
+            if self.known_pairs:
+                symbol = next(iter(self.known_pairs))
+                return next(iter(self.positions[symbol]))
+            return self.explore()
+
+        first = flipped[0]
+        for position in self.positions.get(self.engine.symbols[first], ()):
+            if position != first:
+                return position
+        return self.explore(exclude=first)
+
+    def explore(self, exclude: int | None = None) -> int:
+        """A card not seen yet, or any card still on the board if all are remembered."""
+        pool = self.unknown if len(self.unknown) > (exclude in self.unknown) else self.unmatched
+        while True:
+            position = pool.choice(self.rng)
+            if position != exclude:
+                return position
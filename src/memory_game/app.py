@@ -1,9 +1,25 @@
 import logging
+import sys
 
 from textual.app import App
 
-from memory_game.config import configure_logger, get_configuration
+from memory_game.config import (
+    DEFAULT_LOG_LEVEL,
+    DEFAULT_LOG_RATE_LIMIT,
+    configure_logger,
+    get_configuration,
+    parse_rate_limit,
+)
+from memory_game.game_saver.game_save_manager import GameSaveManager
+from memory_game.game_saver.save_codec import SaveCodec
+from memory_game.game_saver.save_slots import SaveSlots
+from memory_game.gameplay.card_renderers import RENDERERS
 from memory_game.gameplay.gameplay_screen import GameplayScreen
+from memory_game.gameplay.image_cache import image_cache
+from memory_game.gameplay.renderer_names import DEFAULT_RENDERER
+from memory_game.profiling.frame_counter import count_frames
+from memory_game.profiling.profiler import profiler
+from memory_game.stats.stats_store import StatsStore
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +31,84 @@ class MemoryApp(App):
         super().__init__()
         self.config = config
 
+        # one save manager per app, so the key is read once and reused by every save
+        codec = SaveCodec.from_config(config)
+        self.save_manager = GameSaveManager(
+            config.get("game_save_file", ""), config.get("key_save_file", ""), codec
+        )
+        load_manager = GameSaveManager(
+            config.get("game_load_file", ""), config.get("key_load_file", ""), codec
+        )
+        same_files = (load_manager.save_file, load_manager.key_file) == (
+            self.save_manager.save_file,
+            self.save_manager.key_file,
+        )
+        self.load_manager = self.save_manager if same_files else load_manager
+        self.save_slots = SaveSlots(config.get("save_slots_dir", ""), self.save_manager)
+        self.stats_store = StatsStore(config.get("stats_file", ""))
+
     def on_mount(self) -> None:
-        self.push_screen(GameplayScreen(self.config))
+        if profiler.enabled:
+            count_frames(self)
+        # decode card images once, after the first screen is painted
+        self.call_after_refresh(image_cache.warm)
+        self.push_screen(
+            GameplayScreen(
+                self.config,
+                self.save_manager,
+                self.load_manager,
+                self.save_slots,
+                self.stats_store,
+            )
+        )
 
 
 def main():
+    if sys.argv[1:2] == ["simulate"]:
+        from memory_game.simulation.simulator import main as simulate
+
+        simulate(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["analyze"]:
+        from memory_game.simulation.board_stats import main as analyze
+
+        analyze(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["replay"]:
+        from memory_game.replay.replay_log import main as replay
+
+        replay(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["serve"]:
+        from memory_game.network.server import main as serve
+
+        serve(sys.argv[2:])
+        return
+
     configure_logger()
     config = get_configuration()
+    configure_logger(
+        config.get("log_level") or DEFAULT_LOG_LEVEL,
+        parse_rate_limit(config.get("log_rate_limit") or str(DEFAULT_LOG_RATE_LIMIT)),
+    )
+
+    card_renderer = config.get("card_renderer") or DEFAULT_RENDERER
+    if card_renderer in RENDERERS:
+        image_cache.set_renderer(card_renderer)
+    else:
+        logger.warning("Unknown card renderer %s, using %s", card_renderer, DEFAULT_RENDERER)
+
+    if config.get("profile"):
+        profiler.start(use_cprofile=config["profile"] == "cprofile")
 
     app = MemoryApp(config=config)
-    app.run()
+    try:
+        app.run()
+    finally:
+        if profiler.enabled:
+            profiler.stop()
+            for profile_file in profiler.dump(config["profile_output"]):
+                print(f"Profile written to {profile_file}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""Figlet banners rendered ahead of time, so pyfiglet is not loaded at startup.
+
+After changing BANNERS, rebuild `assets/banners.json` with:
+
+    python -m memory_game.banners
+"""
+
+import json
+import logging
+from functools import cache
+from importlib import resources
+from pathlib import Path
+
+from memory_game.engine.game_engine import MAX_PLAYERS
+
+logger = logging.getLogger(__name__)
+
+BANNERS_FILE = "banners.json"
+ASSETS_DIR = Path(__file__).parent / "assets"
+# banner name -> (text, figlet font)
+BANNERS = {
+    "title": ("Memory\nGame", "big"),
+    "game_over": ("GAME OVER", "big"),
+    "draw": ("DRAW", "standard"),
+    **{
+        f"player_{player}_won": (f"PLAYER {player} WON", "standard")
+        for player in range(1, MAX_PLAYERS + 1)
+    },
+}
+
+
+@cache
+def _prerendered() -> dict[str, str]:
+    try:
+        return json.loads((resources.files("memory_game") / "assets" / BANNERS_FILE).read_text())
+    except (OSError, ValueError) as e:
+        logger.warning("Pre-rendered banners not available, rendering with pyfiglet: %s", e)
+        return {}
+
+
+def render_banner(text: str, font: str) -> str:
+    from pyfiglet import figlet_format
+
+    return figlet_format(text, font=font)
+
+
+@cache
+def banner(name: str) -> str:
+    """Banner from the pre-rendered file, rendered with pyfiglet if it is missing there."""
+    prerendered = _prerendered().get(name)
+    if prerendered is not None:
+        return prerendered
+    return render_banner(*BANNERS[name])
+
+
+def build_banners(banners_path: Path) -> None:
+    banners = {name: render_banner(text, font) for name, (text, font) in BANNERS.items()}
+    banners_path.write_text(json.dumps(banners, indent=2) + "\n")
+    logger.info("Wrote %d banners to %s", len(banners), banners_path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    build_banners(ASSETS_DIR / BANNERS_FILE)
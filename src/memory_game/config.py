@@ -1,24 +1,130 @@
 import argparse
+import atexit
 import configparser
 import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 
 from textual.logging import TextualHandler
 
+from memory_game.gameplay.renderer_names import DEFAULT_RENDERER, RENDERER_NAMES
+
 LOG_FILE = "memory_game.log"
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_RATE_LIMIT = 20.0  # records per second of each logger, 0 disables the limit
+DEFAULT_PROFILE_FILE = "memory_game_profile.json"
 logger = logging.getLogger(__name__)
 
 
-def configure_logger():
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    log_date_format = "%Y-%m-%d %H:%M:%S"
-    log_th = TextualHandler()
-    log_fh = logging.FileHandler(LOG_FILE)
-    logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
-        datefmt=log_date_format,
-        handlers=[log_th, log_fh],
-    )
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+    dropped: int = 0
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per logger, so a chatty hot path cannot flood the log.
+
+    Each logger may log `rate` records per second, in bursts of up to one second's
+    worth. Warnings and errors always pass. The next record let through after some
+    were dropped says how many. Handlers sharing the filter see the same decision.
+    """
+
+    def __init__(self, rate: float = DEFAULT_LOG_RATE_LIMIT) -> None:
+        super().__init__()
+        self.rate = rate
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        limited = getattr(record, "rate_limited", None)
+        if limited is None:
+            limited = (
+                self.rate > 0 and record.levelno < logging.WARNING and not self._take(record)
+            )
+            record.rate_limited = limited
+        return not limited
+
+    def _take(self, record: logging.LogRecord) -> bool:
+        burst = max(self.rate, 1)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = _Bucket(burst, now)
+            bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+            if bucket.tokens < 1:
+                bucket.dropped += 1
+                return False
+
+            bucket.tokens -= 1
+            if bucket.dropped:
+                record.suppressed = f" ({bucket.dropped} earlier messages suppressed)"
+                bucket.dropped = 0
+            return True
+
+
+_listener: QueueListener | None = None
+_rate_limit = RateLimitFilter()
+
+
+def parse_rate_limit(value: str) -> float:
+    """Records per second from the config, the default rate if the value is invalid."""
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = -1.0
+    if not rate >= 0:
+        logger.warning("Invalid log rate limit %r, using %s", value, DEFAULT_LOG_RATE_LIMIT)
+        return DEFAULT_LOG_RATE_LIMIT
+    return rate
+
+
+def configure_logger(
+    level: str = DEFAULT_LOG_LEVEL, rate_limit: float = DEFAULT_LOG_RATE_LIMIT
+) -> None:
+    """Log to the Textual console and to LOG_FILE, can be called again to change settings.
+
+    Records are put on a queue and written to the file by a background thread, so
+    logging never waits for the disk. The Textual handler stays on the logging
+    thread, it only hands the message to the devtools console of the running app.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    if _listener is None:
+        file_handler = logging.FileHandler(LOG_FILE, delay=True)
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s%(suppressed)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+                defaults={"suppressed": ""},
+            )
+        )
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, file_handler)
+        _listener.start()
+        # write the records still queued when the app exits
+        atexit.register(_listener.stop)
+
+        queue_handler = QueueHandler(log_queue)
+        textual_handler = TextualHandler()
+        textual_handler.setFormatter(logging.Formatter("%(name)s - %(levelname)s - %(message)s"))
+        for handler in (queue_handler, textual_handler):
+            handler.addFilter(_rate_limit)
+            root.addHandler(handler)
+
+    if isinstance(logging.getLevelName(level.upper()), int):
+        root.setLevel(level.upper())
+    else:
+        root.setLevel(DEFAULT_LOG_LEVEL)
+        logger.warning("Unknown log level %s, using %s", level, DEFAULT_LOG_LEVEL)
+    _rate_limit.rate = rate_limit
 
 
 class ConfigHandler:
@@ -29,9 +135,9 @@ class ConfigHandler:
 
     def read_config(self, setup_file):
         config = configparser.ConfigParser(interpolation=None)
-        logger.info(f"Reading configuration file {setup_file}...")
+        logger.info("Reading configuration file %s...", setup_file)
         config.read(setup_file)
-        logger.info("Read configuration file {setup_file}.")
+        logger.info("Read configuration file %s.", setup_file)
         return config
 
     def load_config_params(self) -> dict[str, str]:
@@ -49,7 +155,15 @@ def get_configuration() -> dict[str, str]:
     """Function to handle configuration loading."""
 
     # Set up argument parser
-    parser = argparse.ArgumentParser(description="Board Game Configuration")
+    parser = argparse.ArgumentParser(
+        description="Board Game Configuration",
+        epilog=(
+            "Run `memory-game simulate --help` to play many games without the UI, "
+            "`memory-game analyze --help` for statistics of each board size, "
+            "`memory-game replay --help` to play back a recorded game, or "
+            "`memory-game serve --help` to host network games."
+        ),
+    )
     parser.add_argument(
         "-c",
         "--config_file",
@@ -58,6 +172,32 @@ def get_configuration() -> dict[str, str]:
         help="Path to config file (INI format file)",
         required=False,
     )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="timers",
+        choices=["timers", "cprofile"],
+        help="Time hot paths and show an overlay with latency and FPS; "
+        "`cprofile` also records a cProfile session",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="profile_file",
+        default=DEFAULT_PROFILE_FILE,
+        help=f"File the profile is written to on exit (default: {DEFAULT_PROFILE_FILE})",
+    )
+    parser.add_argument(
+        "--server",
+        metavar="address",
+        help="Play in a room of a game server, host:port or unix:PATH",
+    )
+    parser.add_argument("--room", help="Room to join on the game server")
+    parser.add_argument(
+        "--card-renderer",
+        choices=RENDERER_NAMES,
+        help="How card images are drawn: halfblock pixels, colored glyphs, or plain ascii "
+        f"for slow links (default: {DEFAULT_RENDERER})",
+    )
     args = parser.parse_args()
     var_args = vars(args)
 
@@ -65,9 +205,15 @@ def get_configuration() -> dict[str, str]:
     if var_args["config_file"]:
         config_handler = ConfigHandler(var_args["config_file"])
         params = config_handler.load_config_params()
-        logger.info(f"Parameters from INI file: {params}")
-        return params
+        logger.info("Parameters from INI file: %s", params)
+    else:
+        logger.info("No configuration file provided.")
+        params = {}
 
-    # If no config file provided, return empty dict
-    logger.info("No configuration file provided.")
-    return {}
+    for key in ("server", "room", "card_renderer"):
+        if var_args[key]:
+            params[key] = var_args[key]
+    if var_args["profile"]:
+        params["profile"] = var_args["profile"]
+        params["profile_output"] = var_args["profile_output"]
+    return params
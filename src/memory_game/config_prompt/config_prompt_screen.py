@@ -9,18 +9,27 @@ from textual.screen import ModalScreen
 from textual.validation import Number
 from textual.widgets import Button, Input, Label, Static
 
+from memory_game.engine.game_engine import (
+    DEFAULT_PLAYERS,
+    MAX_BOARD_SIZE,
+    MAX_PLAYERS,
+    MIN_BOARD_SIZE,
+    MIN_PLAYERS,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class ConfigPromptScreen(ModalScreen):
-    """The screen for the configuration prompt to get board dimensions."""
+    """The screen for the configuration prompt to get board dimensions and players."""
 
     CSS_PATH = Path(__file__).parent.parent / "styles" / "config_prompt_screen.tcss"
 
-    def __init__(self, width: str | None, height: str | None) -> None:
+    def __init__(self, width: str | None, height: str | None, players: str | None = None) -> None:
         super().__init__()
         self.width = width
         self.height = height
+        self.players = players if players else str(DEFAULT_PLAYERS)
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -33,8 +42,8 @@ class ConfigPromptScreen(ModalScreen):
                 placeholder="Enter board width...",
                 validators=[
                     Number(
-                        minimum=2,
-                        maximum=6,
+                        minimum=MIN_BOARD_SIZE,
+                        maximum=MAX_BOARD_SIZE,
                     )
                 ],
             ),
@@ -46,8 +55,21 @@ class ConfigPromptScreen(ModalScreen):
                 placeholder="Enter board height...",
                 validators=[
                     Number(
-                        minimum=2,
-                        maximum=6,
+                        minimum=MIN_BOARD_SIZE,
+                        maximum=MAX_BOARD_SIZE,
+                    )
+                ],
+            ),
+            Label("Number of Players"),
+            Input(
+                id="input_players",
+                type="integer",
+                value=self.players,
+                placeholder="Enter number of players...",
+                validators=[
+                    Number(
+                        minimum=MIN_PLAYERS,
+                        maximum=MAX_PLAYERS,
                     )
                 ],
             ),
@@ -68,8 +90,14 @@ class ConfigPromptScreen(ModalScreen):
 
         if event.validation_result and event.validation_result.is_valid:
             event.input.border_title = "Appropriate value"
+        elif event.input.id == "input_players":
+            event.input.border_title = (
+                f"Invalid value - must be between {MIN_PLAYERS} and {MAX_PLAYERS}"
+            )
         else:
-            event.input.border_title = "Invalid value - must be between 2 and 6"
+            event.input.border_title = (
+                f"Invalid value - must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}"
+            )
 
     def show_warning(self, message: str) -> None:
         """Add or update warning message."""
@@ -79,7 +107,7 @@ class ConfigPromptScreen(ModalScreen):
             existing_warning = self.query_one("#warning-message", expect_type=Label)
             existing_warning.update(message)
         except NoMatches as e:
-            logger.info(f"Expected error when trying to get Label from Query: {e}")
+            logger.info("Expected error when trying to get Label from Query: %s", e)
             # Create new label if doesn't exist
             warning_label = Label(message, id="warning-message")
             self.query_one("#form-container").mount(warning_label)
@@ -89,18 +117,29 @@ class ConfigPromptScreen(ModalScreen):
         """Validate inputs when submit button is pressed."""
         height_input = self.query_one("#input_board_height", Input)
         width_input = self.query_one("#input_board_width", Input)
+        players_input = self.query_one("#input_players", Input)
 
-        # Check if both inputs have values
-        if not height_input.value or not width_input.value:
-            self.show_warning("Both fields are required!")
+        # Check if all inputs have values
+        if not height_input.value or not width_input.value or not players_input.value:
+            self.show_warning("All fields are required!")
             return
 
         height = int(height_input.value)
         width = int(width_input.value)
 
         # Validate ranges
-        if not (2 <= height <= 6 and 2 <= width <= 6):
-            self.show_warning("Board size must be between 2 and 6!")
+        if not (
+            MIN_BOARD_SIZE <= height <= MAX_BOARD_SIZE
+            and MIN_BOARD_SIZE <= width <= MAX_BOARD_SIZE
+        ):
+            self.show_warning(f"Board size must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}!")
+            return
+
+        players = int(players_input.value)
+        if not MIN_PLAYERS <= players <= MAX_PLAYERS:
+            self.show_warning(
+                f"Number of players must be between {MIN_PLAYERS} and {MAX_PLAYERS}!"
+            )
             return
 
         # All cards number should be an even number
@@ -113,5 +152,6 @@ class ConfigPromptScreen(ModalScreen):
             {
                 "board_width": int(width_input.value),
                 "board_height": int(height_input.value),
+                "players": players,
             }
         )
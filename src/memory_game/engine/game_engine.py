@@ -0,0 +1,208 @@
+import logging
+from dataclasses import dataclass
+from random import Random
+from typing import Callable, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+NUMBER_OF_SYMBOLS = 18  # symbols with an image file, the rest is generated
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+DEFAULT_PLAYERS = 2
+# board width and height, in cards
+MIN_BOARD_SIZE = 2
+MAX_BOARD_SIZE = 20
+GENERATED_SYMBOL_PREFIX = "symbol-"
+
+
+def symbol_name(symbol: int) -> str:
+    """Image name of a symbol, as used by the card widgets and save files."""
+    if symbol > NUMBER_OF_SYMBOLS:
+        return f"{GENERATED_SYMBOL_PREFIX}{symbol}"
+    return f"{symbol}.png"
+
+
+def symbol_from_name(name: str) -> int:
+    return int(name.removeprefix(GENERATED_SYMBOL_PREFIX).removesuffix(".png"))
+
+
+def deal_cards(width: int, height: int, rng: Random | None = None) -> bytearray:
+    """Generate cards by choosing symbols from 1 to 18, boards with more pairs
+    use generated symbols as well. Then double the list and shuffle to place
+    them randomly on the board."""
+    rng = rng if rng is not None else Random()
+    pairs = (width * height) // 2
+    symbols = rng.sample(range(1, max(NUMBER_OF_SYMBOLS, pairs) + 1), pairs)
+    symbols.extend(symbols)
+    rng.shuffle(symbols)
+    return bytearray(symbols)
+
+
+@dataclass(frozen=True)
+class CardFlipped:
+    position: int
+    symbol: int
+
+
+@dataclass(frozen=True)
+class PairMatched:
+    player: int
+    first: int
+    second: int
+    score: int
+
+
+@dataclass(frozen=True)
+class PairMissed:
+    player: int
+    first: int
+    second: int
+
+
+@dataclass(frozen=True)
+class CardsHidden:
+    first: int
+    second: int
+
+
+@dataclass(frozen=True)
+class TurnChanged:
+    player: int
+
+
+@dataclass(frozen=True)
+class GameOver:
+    scores: tuple[int, ...]
+
+
+GameEvent = Union[CardFlipped, PairMatched, PairMissed, CardsHidden, TurnChanged, GameOver]
+Listener = Callable[[GameEvent], None]
+
+
+class GameEngine:
+    """Rules of the memory game without any UI.
+
+    Cards are kept as a bytearray of symbol numbers in row-major order, with a matching
+    bytearray of matched flags and a counter of pairs still on the board, so checking
+    for the end of the game is constant time. Scores are a list indexed by player,
+    its length is the number of players. Views subscribe to the engine and react to
+    its events.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        symbols: Sequence[int],
+        matched: Sequence[int] | None = None,
+        scores: Sequence[int] = (0, 0),
+        current_player: int = 1,
+        turns: int = 0,
+    ) -> None:
+        if len(symbols) != width * height:
+            raise ValueError(f"Expected {width * height} cards, got {len(symbols)}")
+        if not MIN_PLAYERS <= len(scores) <= MAX_PLAYERS:
+            raise ValueError(
+                f"Expected {MIN_PLAYERS} to {MAX_PLAYERS} players, got {len(scores)}"
+            )
+
+        self.width = width
+        self.height = height
+        self.symbols = bytearray(symbols)
+        self.matched = bytearray(matched) if matched else bytearray(len(self.symbols))
+        self.remaining_pairs = (len(self.matched) - sum(self.matched)) // 2
+        self.scores = list(scores)
+        self.current_player = current_player
+        self.flipped: list[int] = []
+        self.turns = turns
+        self._listeners: list[Listener] = []
+
+    @classmethod
+    def new_game(
+        cls,
+        width: int,
+        height: int,
+        rng: Random | None = None,
+        players: int = DEFAULT_PLAYERS,
+    ) -> "GameEngine":
+        return cls(width, height, deal_cards(width, height, rng), scores=(0,) * players)
+
+    @property
+    def players(self) -> int:
+        return len(self.scores)
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        self._listeners.remove(listener)
+
+    def _emit(self, event: GameEvent) -> None:
+        for listener in self._listeners:
+            listener(event)
+
+    @property
+    def awaiting_resolve(self) -> bool:
+        """Two different cards are face up and must be hidden before the next flip."""
+        return len(self.flipped) == 2
+
+    @property
+    def is_over(self) -> bool:
+        return self.remaining_pairs == 0
+
+    def matched_snapshot(self) -> bytes:
+        """Copy of the matched flags, one byte per card."""
+        return bytes(self.matched)
+
+    def can_flip(self, position: int) -> bool:
+        return (
+            len(self.flipped) < 2
+            and not self.matched[position]
+            and position not in self.flipped
+        )
+
+    def flip(self, position: int) -> bool:
+        """Turn over a card. Returns False if the card cannot be flipped now."""
+        if not self.can_flip(position):
+            return False
+
+        self.flipped.append(position)
+        if self._listeners:
+            self._emit(CardFlipped(position, self.symbols[position]))
+
+        if len(self.flipped) == 2:
+            self._check_match()
+        return True
+
+    def _check_match(self) -> None:
+        """Check if the two flipped cards match."""
+        first, second = self.flipped
+        player = self.current_player
+        self.turns += 1
+
+        if self.symbols[first] == self.symbols[second]:
+            self.matched[first] = self.matched[second] = 1
+            self.remaining_pairs -= 1
+            self.scores[player - 1] += 1
+            self.flipped = []
+            if self._listeners:
+                self._emit(PairMatched(player, first, second, self.scores[player - 1]))
+
+            if self.is_over and self._listeners:
+                self._emit(GameOver(tuple(self.scores)))
+        else:
+            # the player keeps seeing both cards until resolve(), but the turn passes now
+            self.current_player = player % len(self.scores) + 1
+            if self._listeners:
+                self._emit(PairMissed(player, first, second))
+                self._emit(TurnChanged(self.current_player))
+
+    def resolve(self) -> None:
+        """Hide two mismatched cards, so the next player can flip."""
+        if not self.awaiting_resolve:
+            return
+
+        first, second = self.flipped
+        self.flipped = []
+        if self._listeners:
+            self._emit(CardsHidden(first, second))
@@ -1,34 +1,62 @@
 from pathlib import Path
+from typing import Sequence
 
-from pyfiglet import figlet_format
 from textual.app import ComposeResult
-from textual.containers import Container
+from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Button, Static
 
+from memory_game.banners import banner
+
+
+def rank_players(scores: Sequence[int]) -> list[tuple[int, int, int]]:
+    """(rank, player, score) from the best score down, tied players share a rank."""
+    ordered = sorted(enumerate(scores, start=1), key=lambda item: -item[1])
+    ranking = []
+    for index, (player, score) in enumerate(ordered):
+        rank = ranking[-1][0] if ranking and ranking[-1][2] == score else index + 1
+        ranking.append((rank, player, score))
+    return ranking
+
+
+class GameOverScreen(ModalScreen[str | None]):
+    """Show the result, dismissed with "rematch", "new_game", "leaderboard" or None to close."""
 
-class GameOverScreen(ModalScreen):
     CSS_PATH = Path(__file__).parent.parent / "styles" / "game_over_screen.tcss"
 
-    def __init__(self, player1_score: int, player2_score: int) -> None:
-        """Initialize the GameOverScreen to show which player won."""
+    def __init__(self, scores: Sequence[int]) -> None:
+        """Initialize the GameOverScreen to show which player won and the ranking."""
         super().__init__()
-        self.player1_score = player1_score
-        self.player2_score = player2_score
-        if self.player1_score > self.player2_score:
-            self.who_won = figlet_format("PLAYER 1 WON")
-        elif self.player1_score < self.player2_score:
-            self.who_won = figlet_format("PLAYER 2 WON")
+        self.ranking = rank_players(scores)
+        winners = [player for rank, player, _ in self.ranking if rank == 1]
+        if len(winners) == 1:
+            self.who_won = banner(f"player_{winners[0]}_won")
         else:
-            self.who_won = figlet_format("DRAW")
+            self.who_won = banner("draw")
 
     def compose(self) -> ComposeResult:
+        ranking = "\n".join(
+            f"{rank}. Player {player}: {score} {'pair' if score == 1 else 'pairs'}"
+            for rank, player, score in self.ranking
+        )
         yield Container(
-            Static(figlet_format("GAME OVER", font="big"), classes="game-over"),
+            Static(banner("game_over"), classes="game-over"),
             Static(self.who_won, classes="game-over"),
-            Button("Close", variant="error", id="close-button"),
+            Static(ranking, id="ranking"),
+            Horizontal(
+                Button("Rematch", variant="success", id="rematch-button"),
+                Button("New game", variant="primary", id="new-game-button"),
+                Button("Leaderboard", id="leaderboard-button"),
+                Button("Close", variant="error", id="close-button"),
+                id="game-over-buttons",
+            ),
             classes="game-over-modal",
         )
 
-    def on_button_pressed(self) -> None:
-        self.app.pop_screen()
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        choices = {
+            "rematch-button": "rematch",
+            "new-game-button": "new_game",
+            "leaderboard-button": "leaderboard",
+        }
+        self.dismiss(choices.get(event.button.id or ""))
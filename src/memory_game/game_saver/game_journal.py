@@ -0,0 +1,175 @@
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+from memory_game.game_saver.game_save_manager import (
+    GameSaveManager,
+    GameState,
+    read_varint,
+    write_varint,
+)
+from memory_game.game_saver.save_codec import HEADER_SIZE, SaveCodec, SaveDecodeError
+from memory_game.profiling.profiler import profiled
+
+logger = logging.getLogger(__name__)
+JOURNAL_SUFFIX = ".journal"
+DEFAULT_COMPACT_TURNS = 20
+
+
+def compact_turns_from_config(config: dict[str, str]) -> int:
+    """Turns between journal compactions, the default one if the setting is invalid."""
+    value = config.get("autosave_compact_turns") or str(DEFAULT_COMPACT_TURNS)
+    try:
+        compact_turns = int(value)
+    except ValueError:
+        compact_turns = 0
+    if compact_turns < 1:
+        logger.warning(
+            "Invalid autosave_compact_turns %r, compacting every %d turns",
+            value,
+            DEFAULT_COMPACT_TURNS,
+        )
+        return DEFAULT_COMPACT_TURNS
+    return compact_turns
+
+
+@dataclass
+class TurnRecord:
+    turn: int
+    first: int
+    second: int
+    matched: bool
+    player: int
+    score_delta: int
+
+
+class GameJournal:
+    """Append-only log of resolved turns, kept next to the save file.
+
+    Every turn is stored as one length-prefixed record encrypted with the cipher of
+    the save codec, so persisting a turn costs the same on any board size. The
+    journal starts with a codec header, like a save, and is periodically compacted
+    into a full snapshot written by the save manager. All writes go through a single
+    worker thread, which keeps them in order and off the event loop.
+    """
+
+    def __init__(
+        self, save_manager: GameSaveManager, compact_turns: int = DEFAULT_COMPACT_TURNS
+    ) -> None:
+        self.save_manager = save_manager
+        self.journal_file = save_manager.save_file + JOURNAL_SUFFIX
+        self.compact_turns = compact_turns
+        # records are small JSON objects, compressing them would only add overhead
+        self.codec = SaveCodec("json", "none", save_manager.codec.cipher)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journal")
+
+    @profiled("GameJournal.append")
+    def append(self, record: TurnRecord) -> None:
+        """Append one turn and flush it to disk."""
+        codec = self.codec
+        payload = self.save_manager.encrypt(
+            codec.cipher, json.dumps(asdict(record)).encode(), codec.header
+        )
+        buffer = bytearray()
+        write_varint(buffer, len(payload))
+        buffer.extend(payload)
+        with open(self.journal_file, "ab") as f:
+            f.write(buffer)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self, game_state: GameState) -> None:
+        """Write a full snapshot, then drop the turns it already contains."""
+        self.save_manager.save_game(game_state)
+        with open(self.journal_file, "wb") as f:
+            f.write(self.codec.header)
+        logger.info("Journal compacted at turn %d", game_state.turns)
+
+    async def append_async(self, record: TurnRecord) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.append, record)
+
+    async def compact_async(self, game_state: GameState) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.compact, game_state)
+
+    def replay(self, game_state: GameState) -> GameState:
+        """Apply turns recorded after the snapshot to the game state."""
+        if not os.path.exists(self.journal_file):
+            return game_state
+
+        with open(self.journal_file, "rb") as f:
+            data = f.read()
+
+        try:
+            records = self.read_records(data)
+        except SaveDecodeError as e:
+            logger.error("Skipping unreadable journal %s: %s", self.journal_file, e)
+            return game_state
+
+        replayed = 0
+        for record in records:
+            # records older than the snapshot are left over from an interrupted compaction
+            if record.turn <= game_state.turns:
+                continue
+
+            apply_turn(game_state, record)
+            replayed += 1
+
+        logger.info("Replayed %d turns from %s", replayed, self.journal_file)
+        return game_state
+
+    def read_records(self, data: bytes) -> list[TurnRecord]:
+        """Readable records of a journal, written with any cipher."""
+        from cryptography.exceptions import InvalidTag
+        from cryptography.fernet import InvalidToken
+
+        codec = SaveCodec.read_header(data)
+        if codec is None:
+            if not data:
+                return []
+            raise SaveDecodeError("Journal has no codec header")
+        cipher, header = codec.cipher, data[:HEADER_SIZE]
+        payloads = split_records(data, HEADER_SIZE)
+
+        records = []
+        for payload in payloads:
+            try:
+                plain = self.save_manager.decrypt(cipher, payload, header)
+                records.append(TurnRecord(**json.loads(plain)))
+            except (InvalidToken, InvalidTag, ValueError, TypeError) as e:
+                logger.warning("Skipping unreadable journal record: %s", e)
+        return records
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def split_records(data: bytes, offset: int) -> list[bytes]:
+    """Payloads of the length-prefixed records after the offset."""
+    payloads = []
+    while offset < len(data):
+        try:
+            size, start = read_varint(data, offset)
+        except IndexError:
+            size, start = len(data), len(data)
+        if start + size > len(data):
+            # a crash while appending can leave the last record incomplete
+            logger.warning("Skipping incomplete journal record at byte %d", offset)
+            break
+        payloads.append(data[start : start + size])
+        offset = start + size
+    return payloads
+
+
+def apply_turn(game_state: GameState, record: TurnRecord) -> None:
+    game_state.turns = record.turn
+    players = game_state.players
+    if record.matched:
+        game_state.cards.matched_cards[record.first] = True
+        game_state.cards.matched_cards[record.second] = True
+        players.scores[record.player - 1] += record.score_delta
+        players.current_player = record.player
+    else:
+        players.current_player = record.player % len(players.scores) + 1
@@ -1,14 +1,57 @@
+import asyncio
 import json
 import logging
 import os
+import tempfile
+import threading
 from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
 
-from cryptography.fernet import Fernet, InvalidToken
+from memory_game.engine.game_engine import symbol_name
+from memory_game.game_saver.save_codec import HEADER_SIZE, SaveCodec, SaveDecodeError
+from memory_game.profiling.profiler import profiled
+
+if TYPE_CHECKING:
+    # cryptography is imported on the first save or load, not at startup
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 logger = logging.getLogger(__name__)
 DEFAULT_SAVE_FILE = "game_save.dat"
 DEFAULT_KEY_FILE = "save.key"
 
+# Binary save layout: magic, version byte, varints (width, height, current player,
+# turns, player count, scores...), one byte per card symbol, matched cards bitmap.
+SAVE_MAGIC = b"MGSV"
+SAVE_FORMAT_VERSION = 1
+# lookup tables, so encoding and decoding do not format or parse strings per card
+SYMBOL_NAMES = [symbol_name(symbol) for symbol in range(256)]
+SYMBOL_NUMBERS = {name: symbol for symbol, name in enumerate(SYMBOL_NAMES)}
+BYTE_BITS = [tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)]
+AESGCM_NONCE_SIZE = 12
+# the AES-GCM key is derived from the Fernet key file, so both ciphers share one key file
+AESGCM_KEY_INFO = b"memory-game save aes-gcm"
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint, returning the value and the next offset."""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
 
 @dataclass
 class BoardState:
@@ -16,17 +59,20 @@ class BoardState:
     height: int
 
 
-@dataclass
-class PlayerState:
-    score: int
-
-
 @dataclass
 class PlayersState:
-    player1: PlayerState
-    player2: PlayerState
+    scores: list[int]  # score of player N at index N - 1
     current_player: int
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "PlayersState":
+        if "scores" in data:
+            scores = data["scores"]
+        else:
+            # two player saves written before the scores list
+            scores = [data["player1"]["score"], data["player2"]["score"]]
+        return cls(scores=scores, current_player=data["current_player"])
+
 
 @dataclass
 class CardsState:
@@ -39,25 +85,90 @@ class GameState:
     board: BoardState
     players: PlayersState
     cards: CardsState
+    turns: int = 0
 
     @classmethod
     def from_dict(cls, data: dict) -> "GameState":
         return cls(
             board=BoardState(width=data["board"]["width"], height=data["board"]["height"]),
-            players=PlayersState(
-                player1=PlayerState(score=data["players"]["player1"]["score"]),
-                player2=PlayerState(score=data["players"]["player2"]["score"]),
-                current_player=data["players"]["current_player"],
-            ),
+            players=PlayersState.from_dict(data["players"]),
             cards=CardsState(
                 all_cards=data["cards"]["all_cards"],
                 matched_cards=data["cards"]["matched_cards"],
             ),
+            turns=data.get("turns", 0),
+        )
+
+    def to_json(self) -> bytes:
+        return json.dumps(asdict(self), separators=(",", ":")).encode()
+
+    def to_bytes(self) -> bytes:
+        """Encode the state in the compact binary save format."""
+        buffer = bytearray(SAVE_MAGIC)
+        buffer.append(SAVE_FORMAT_VERSION)
+        scores = self.players.scores
+        for value in (
+            self.board.width,
+            self.board.height,
+            self.players.current_player,
+            self.turns,
+            len(scores),
+            *scores,
+        ):
+            write_varint(buffer, value)
+
+        buffer.extend(SYMBOL_NUMBERS[card] for card in self.cards.all_cards)
+
+        matched = self.cards.matched_cards
+        buffer.extend(
+            sum(1 << bit for bit, flag in enumerate(matched[start : start + 8]) if flag)
+            for start in range(0, len(matched), 8)
+        )
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameState":
+        """Decode the binary save format written by to_bytes."""
+        if data[: len(SAVE_MAGIC)] != SAVE_MAGIC:
+            raise ValueError("Not a binary game save")
+        version = data[len(SAVE_MAGIC)]
+        if version != SAVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported save format version {version}")
+
+        offset = len(SAVE_MAGIC) + 1
+        width, offset = read_varint(data, offset)
+        height, offset = read_varint(data, offset)
+        current_player, offset = read_varint(data, offset)
+        turns, offset = read_varint(data, offset)
+        player_count, offset = read_varint(data, offset)
+        scores = []
+        for _ in range(player_count):
+            score, offset = read_varint(data, offset)
+            scores.append(score)
+
+        cards_count = width * height
+        all_cards = [SYMBOL_NAMES[symbol] for symbol in data[offset : offset + cards_count]]
+        offset += cards_count
+        bitmap = data[offset : offset + (cards_count + 7) // 8]
+        matched_cards = [flag for byte in bitmap for flag in BYTE_BITS[byte]][:cards_count]
+
+        return cls(
+            board=BoardState(width=width, height=height),
+            players=PlayersState(scores=scores, current_player=current_player),
+            cards=CardsState(all_cards=all_cards, matched_cards=matched_cards),
+            turns=turns,
         )
 
+    @classmethod
+    def decode(cls, data: bytes) -> "GameState":
+        """Decode a binary or a JSON save."""
+        if data.startswith(SAVE_MAGIC):
+            return cls.from_bytes(data)
+        return cls.from_dict(json.loads(data))
+
 
 class GameSaveManager:
-    def __init__(self, save_file: str, key_file: str) -> None:
+    def __init__(self, save_file: str, key_file: str, codec: SaveCodec | None = None) -> None:
         current_dir = os.getcwd()
 
         # if save_file or key_file was left empty in INI file, use default values
@@ -70,53 +181,166 @@ class GameSaveManager:
         self.key_file = (
             key_file if os.path.isabs(key_file) else os.path.join(current_dir, key_file)
         )
-        logger.info(f"Save manager: save file: {self.save_file}")
-        logger.info(f"Save manager: key file: {self.key_file}")
+        logger.info("Save manager: save file: %s", self.save_file)
+        logger.info("Save manager: key file: %s", self.key_file)
+        # chain new saves are written with, loads read the chain from the save header
+        self.codec = codec if codec is not None else SaveCodec()
+
+        # key is read on first use and cached until the key file changes
+        self.key: bytes | None = None
+        self._fernet: Fernet | None = None
+        self._aesgcm: AESGCM | None = None
+        self._key_mtime: int | None = None
+        self._key_lock = threading.Lock()
+        self._save_dir_created = False
+
+    @property
+    def fernet(self) -> "Fernet":
+        """Fernet for the key file, re-read only when the key file modification time changes."""
+        with self._key_lock:
+            try:
+                key_mtime: int | None = os.stat(self.key_file).st_mtime_ns
+            except FileNotFoundError:
+                key_mtime = None
+
+            if self._fernet is None or key_mtime != self._key_mtime:
+                self._fernet = self.load_key(key_mtime)
+                self._aesgcm = None
+            return self._fernet
+
+    @property
+    def aesgcm(self) -> "AESGCM":
+        """AES-GCM with a key derived from the key file, re-derived when the key changes."""
+        self.fernet  # re-reads a changed key file and drops the derived key
+        with self._key_lock:
+            if self._aesgcm is None:
+                self._aesgcm = self.derive_aesgcm()
+            return self._aesgcm
+
+    def derive_aesgcm(self) -> "AESGCM":
+        import base64
 
-        if os.path.exists(self.key_file):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+        assert self.key is not None
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=AESGCM_KEY_INFO)
+        return AESGCM(hkdf.derive(base64.urlsafe_b64decode(self.key)))
+
+    def load_key(self, key_mtime: int | None) -> "Fernet":
+        from cryptography.fernet import Fernet
+
+        if key_mtime is not None:
             with open(self.key_file, "rb") as f:
                 self.key = f.read()
         else:
-            self.key = Fernet.generate_key()
-            os.makedirs(os.path.dirname(self.key_file), exist_ok=True)
-            with open(self.key_file, "wb") as f:
-                f.write(self.key)
+            self.generate_key()
 
         try:
-            self.fernet = Fernet(self.key)
+            fernet = Fernet(self.key)
         except ValueError as e:
-            logger.error(f"Invalid key, overwriting key file and generating new key, error: {e}")
+            logger.error("Invalid key, overwriting key file and generating new key, error: %s", e)
             self.generate_key()
-            self.fernet = Fernet(self.key)
+            fernet = Fernet(self.key)
+
+        self._key_mtime = os.stat(self.key_file).st_mtime_ns
+        return fernet
 
     def generate_key(self):
+        from cryptography.fernet import Fernet
+
         self.key = Fernet.generate_key()
         os.makedirs(os.path.dirname(self.key_file), exist_ok=True)
         with open(self.key_file, "wb") as f:
             f.write(self.key)
 
+    @staticmethod
+    def write_atomic(path: str, data: bytes) -> None:
+        """Write data to a temporary file next to path and rename it over path,
+        so an interrupted save never leaves a truncated file behind."""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def encode(self, game_state: GameState) -> bytes:
+        """Header of the codec chain followed by the serialized, compressed, encrypted state."""
+        codec = self.codec
+        data = game_state.to_json() if codec.serializer == "json" else game_state.to_bytes()
+        header = codec.header
+        return header + self.encrypt(codec.cipher, codec.compress(data), header)
+
+    def decode(self, data: bytes) -> GameState:
+        """Decode a save written with any codec chain, or before the chains existed."""
+        from cryptography.exceptions import InvalidTag
+        from cryptography.fernet import InvalidToken
+
+        codec = SaveCodec.read_header(data)
+        try:
+            if codec is None:
+                # Fernet token of the binary or JSON state
+                return GameState.decode(self.fernet.decrypt(data))
+            header, payload = data[:HEADER_SIZE], data[HEADER_SIZE:]
+            return GameState.decode(codec.decompress(self.decrypt(codec.cipher, payload, header)))
+        except (InvalidToken, InvalidTag):
+            raise SaveDecodeError(
+                "Save file is corrupted, maybe it was encrypted with another key"
+            ) from None
+        except SaveDecodeError:
+            raise
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            # zlib.error, lzma.LZMAError and JSON errors are ValueErrors too
+            raise SaveDecodeError(f"Save file is corrupted: {e}") from e
+
+    def encrypt(self, cipher: str, data: bytes, header: bytes) -> bytes:
+        if cipher == "fernet":
+            return self.fernet.encrypt(data)
+        if cipher == "aesgcm":
+            # the header is authenticated with the state, a changed chain fails to load
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            return nonce + self.aesgcm.encrypt(nonce, data, header)
+        return data
+
+    def decrypt(self, cipher: str, data: bytes, header: bytes) -> bytes:
+        if cipher == "fernet":
+            return self.fernet.decrypt(data)
+        if cipher == "aesgcm":
+            nonce, ciphertext = data[:AESGCM_NONCE_SIZE], data[AESGCM_NONCE_SIZE:]
+            return self.aesgcm.decrypt(nonce, ciphertext, header)
+        return data
+
+    @profiled("GameSaveManager.save_game")
     def save_game(self, game_state: GameState) -> tuple[str, str]:
         """
-        Save game data to an encrypted file
+        Save game data to a file encoded with the codec chain
 
         Args:
             game_state (GameState): Current game state
         """
-        os.makedirs(os.path.dirname(self.save_file), exist_ok=True)
-
-        # Convert GameState to dictionary using dataclass's asdict
-        json_data = json.dumps(asdict(game_state))
-        encrypted_data = self.fernet.encrypt(json_data.encode())
+        if not self._save_dir_created:
+            os.makedirs(os.path.dirname(self.save_file), exist_ok=True)
+            self._save_dir_created = True
 
-        with open(self.save_file, "wb") as f:
-            f.write(encrypted_data)
+        self.write_atomic(self.save_file, self.encode(game_state))
 
         # Return save and key file paths
         return self.save_file, self.key_file
 
+    async def save_game_async(self, game_state: GameState) -> tuple[str, str]:
+        """Save game data in a worker thread, without blocking the event loop."""
+        return await asyncio.to_thread(self.save_game, game_state)
+
+    @profiled("GameSaveManager.load_game")
     def load_game(self) -> GameState | None:
         """
-        Load game data from encrypted file
+        Load game data from a file written with any codec chain
 
         Returns:
             Optional[GameState]: Loaded game state or None if file doesn't exist
@@ -125,14 +349,23 @@ class GameSaveManager:
             return None
 
         with open(self.save_file, "rb") as f:
-            encrypted_data = f.read()
+            data = f.read()
 
         try:
-            json_data = self.fernet.decrypt(encrypted_data).decode()
-        except InvalidToken:
-            logger.error("Save file is corrupted, maybe it was decrpted with wrong key")
+            game_state = self.decode(data)
+        except SaveDecodeError as e:
+            logger.error("%s", e)
             return None
 
-        data_dict = json.loads(json_data)
-        logger.info(f"Loaded game state: {data_dict}")
-        return GameState.from_dict(data_dict)
+        logger.info(
+            "Loaded %dx%d game at turn %d",
+            game_state.board.width,
+            game_state.board.height,
+            game_state.turns,
+        )
+        logger.debug("Loaded game state: %s", game_state)
+        return game_state
+
+    async def load_game_async(self) -> GameState | None:
+        """Load game data in a worker thread, without blocking the event loop."""
+        return await asyncio.to_thread(self.load_game)
@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+from memory_game.game_saver.game_save_manager import GameSaveManager, GameState
+from memory_game.game_saver.save_codec import SaveDecodeError
+
+logger = logging.getLogger(__name__)
+DEFAULT_SLOTS_DIR = "saves"
+INDEX_FILE = "index.json"
+SLOT_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+@dataclass
+class SlotInfo:
+    """Metadata of a save slot, readable without decrypting the save."""
+
+    name: str
+    width: int
+    height: int
+    scores: list[int]
+    current_player: int
+    turns: int
+    saved_at: float
+
+
+class SaveSlots:
+    """Named saves in one directory, listed by a plain JSON index.
+
+    The index holds only metadata, so listing slots reads a single small file
+    and only the chosen slot is ever decrypted. Slots are encoded by the save
+    manager of the app, so they share its codec chain and cached key.
+    """
+
+    def __init__(self, slots_dir: str, save_manager: GameSaveManager) -> None:
+        slots_dir = slots_dir if slots_dir else DEFAULT_SLOTS_DIR
+        self.slots_dir = os.path.abspath(slots_dir)
+        self.index_file = os.path.join(self.slots_dir, INDEX_FILE)
+        self.save_manager = save_manager
+        self._index: dict[str, SlotInfo] | None = None
+        self._lock = threading.Lock()
+
+    def slot_file(self, name: str) -> str:
+        if not SLOT_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid save slot name: {name!r}")
+        return os.path.join(self.slots_dir, f"{name}.dat")
+
+    def read_index(self) -> dict[str, SlotInfo]:
+        """Slots metadata, read from disk once and then kept up to date in memory."""
+        if self._index is None:
+            try:
+                with open(self.index_file, "rb") as f:
+                    entries = json.load(f)
+                self._index = {entry["name"]: SlotInfo(**entry) for entry in entries}
+            except FileNotFoundError:
+                self._index = {}
+            except (ValueError, TypeError, KeyError) as e:
+                logger.error("Save slots index is corrupted, starting a new one: %s", e)
+                self._index = {}
+        return self._index
+
+    def list_slots(self) -> list[SlotInfo]:
+        """All slots, most recently saved first."""
+        with self._lock:
+            return sorted(self.read_index().values(), key=lambda slot: -slot.saved_at)
+
+    def save_new(self, name: str, game_state: GameState) -> tuple[str, str]:
+        """Save the game to a new slot, adding a counter to the name if it is taken."""
+        with self._lock:
+            index = self.read_index()
+            slot_name, counter = name, 1
+            while slot_name in index:
+                counter += 1
+                slot_name = f"{name}-{counter}"
+            return slot_name, self.write_slot(slot_name, game_state)
+
+    def write_slot(self, name: str, game_state: GameState) -> str:
+        """Save the game to a slot and record its metadata in the index, under the lock."""
+        slot_file = self.slot_file(name)
+        os.makedirs(self.slots_dir, exist_ok=True)
+        GameSaveManager.write_atomic(slot_file, self.save_manager.encode(game_state))
+        index = self.read_index()
+        index[name] = SlotInfo(
+            name=name,
+            width=game_state.board.width,
+            height=game_state.board.height,
+            scores=list(game_state.players.scores),
+            current_player=game_state.players.current_player,
+            turns=game_state.turns,
+            saved_at=time.time(),
+        )
+        entries = [asdict(slot) for slot in index.values()]
+        GameSaveManager.write_atomic(self.index_file, json.dumps(entries).encode())
+        return slot_file
+
+    def load(self, name: str) -> GameState | None:
+        """Decode and load a single slot."""
+        try:
+            with open(self.slot_file(name), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            return self.save_manager.decode(data)
+        except SaveDecodeError as e:
+            logger.error("Save slot %s: %s", name, e)
+            return None
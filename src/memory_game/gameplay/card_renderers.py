@@ -0,0 +1,114 @@
+"""Backends drawing card images as terminal cells.
+
+Every backend draws an image at an exact size in cells, so faces can be scaled to
+the region of the card. They differ in what they write to the terminal:
+
+- `halfblock`: two true color pixels per cell, the most detailed,
+- `glyph`: one shade glyph per cell in one of the 16 standard colors,
+- `ascii`: one ASCII character per cell without any color, for slow links.
+"""
+
+import io
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from rich.color import Color, ColorSystem
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.segment import Segment
+from rich.style import Style
+
+from memory_game.gameplay.renderer_names import ASCII, GLYPH, HALFBLOCK
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Size of a card face in terminal cells (columns, rows)
+CellSize = tuple[int, int]
+
+
+class CardImage:
+    """Lines of segments drawn by a renderer, one per terminal row."""
+
+    def __init__(self, lines: list[list[Segment]]) -> None:
+        self.lines = lines
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        for line in self.lines:
+            yield from line
+            yield new_line
+
+
+class CardRenderer(ABC):
+    name = ""
+
+    @abstractmethod
+    def render(self, image: "Image.Image", cell_size: CellSize) -> RenderableType:
+        """Draw the image exactly cell_size cells large."""
+
+
+class HalfBlockRenderer(CardRenderer):
+    name = HALFBLOCK
+
+    def render(self, image: "Image.Image", cell_size: CellSize) -> RenderableType:
+        from rich_pixels import Pixels
+
+        # half-cell rendering packs two pixel rows into one terminal row
+        columns, rows = cell_size
+        return Pixels.from_image(image, resize=(columns, rows * 2))
+
+
+class GlyphRenderer(CardRenderer):
+    """One character per cell, denser for brighter parts of the image."""
+
+    name = GLYPH
+    ramp = " ░▒▓█"
+    colored = True
+
+    def render(self, image: "Image.Image", cell_size: CellSize) -> RenderableType:
+        from PIL import Image
+
+        columns, rows = cell_size
+        resample = Image.Resampling.NEAREST if columns >= image.width else Image.Resampling.BOX
+        cells = image.convert("RGB").resize(cell_size, resample=resample)
+        pixels = cells.load()
+        luminance = cells.convert("L")
+        darkest, brightest = luminance.getextrema()
+        shades = luminance.load()
+        scale = (len(self.ramp) - 1) / max(brightest - darkest, 1)
+
+        lines = []
+        for y in range(rows):
+            line = []
+            for x in range(columns):
+                glyph = self.ramp[round((shades[x, y] - darkest) * scale)]
+                line.append(Segment(glyph, self.style(pixels[x, y])))
+            lines.append(Segment.simplify(line))
+        return CardImage(lines)
+
+    def style(self, rgb: tuple[int, int, int]) -> Style | None:
+        if not self.colored:
+            return None
+        # neighbouring cells often share a standard color, and one escape code
+        return Style(color=Color.from_rgb(*rgb).downgrade(ColorSystem.STANDARD))
+
+
+class AsciiRenderer(GlyphRenderer):
+    name = ASCII
+    ramp = " .:-=+*#%@"
+    colored = False
+
+
+RENDERERS: dict[str, CardRenderer] = {
+    renderer.name: renderer for renderer in (HalfBlockRenderer(), GlyphRenderer(), AsciiRenderer())
+}
+
+
+def frame_bytes(renderable: RenderableType, width: int) -> int:
+    """Bytes a true color terminal receives to draw the renderable."""
+    output = io.StringIO()
+    console = Console(
+        file=output, width=width, force_terminal=True, color_system="truecolor"
+    )
+    console.print(renderable, end="")
+    return len(output.getvalue().encode())
@@ -1,31 +1,84 @@
 import logging
-import pathlib
-from typing import cast
 
 from rich.console import RenderableType
-from rich_pixels import Pixels
+from textual import events
 from textual.app import ComposeResult
 from textual.containers import Grid
+from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Button
 
+from memory_game.gameplay.card_renderers import CellSize
+from memory_game.gameplay.image_cache import DEFAULT_IMAGE, NATIVE_CELL_SIZE, image_cache
+from memory_game.profiling.profiler import profiled
+
 logger = logging.getLogger(__name__)
 
-DEFAULT_IMAGE = "question_mark.png"
+# card sizes in cells (columns, rows): half, native, 1.5x and double size of the images
+CARD_SIZES: list[CellSize] = [(6, 3), NATIVE_CELL_SIZE, (18, 9), (24, 12)]
+DEFAULT_CARD_SIZE = NATIVE_CELL_SIZE
+# grid-gutter of CardGrid in gameplay_screen.tcss (columns, rows)
+CARD_GUTTER = (2, 1)
+# rows under a board that fits the screen: its bottom margin and the Next player button
+BOARD_FOOTER_ROWS = 5
+
+
+def fit_card_size(columns: int, rows: int, width: int, height: int) -> CellSize:
+    """Card size for a board shown in width x height cells.
+
+    Cards grow beyond the default size only while the whole board stays visible,
+    and shrink below it only to fit the width, taller boards scroll.
+    """
+
+    def board_size(card_size: CellSize) -> tuple[int, int]:
+        return (
+            columns * card_size[0] + (columns - 1) * CARD_GUTTER[0],
+            rows * card_size[1] + (rows - 1) * CARD_GUTTER[1],
+        )
+
+    fit_width = [size for size in CARD_SIZES if board_size(size)[0] <= width]
+    if not fit_width:
+        return CARD_SIZES[0]
+    card_size = min(fit_width[-1], DEFAULT_CARD_SIZE)
+    for size in fit_width:
+        if size > card_size and board_size(size)[1] <= height:
+            card_size = size
+    return card_size
 
 
-class ImageWidget(Widget):
-    """A widget that displays images using rich-pixels."""
+class CardFace(Widget):
+    """A widget that displays either the front or the back image of a card.
 
-    def __init__(self, image_path: str) -> None:
+    The images are drawn by the renderer of the image cache at the size of the card.
+    """
+
+    face_up = reactive(False)
+
+    def __init__(self, symbol: str, cell_size: CellSize = DEFAULT_CARD_SIZE) -> None:
         super().__init__()
+        self.symbol = symbol
+        self.cell_size = cell_size
+        self.load_images()
+
+    def load_images(self) -> None:
+        self.front = image_cache.get(self.symbol, self.cell_size)
+        self.back = image_cache.get(DEFAULT_IMAGE, self.cell_size)
+
+    def set_symbol(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.front = image_cache.get(symbol, self.cell_size)
+        if self.face_up:
+            self.refresh()
 
-        project_dir = pathlib.Path(__file__).parent.parent
-        self.image_path = project_dir / "assets" / "images" / image_path
+    def set_cell_size(self, cell_size: CellSize) -> None:
+        if cell_size != self.cell_size:
+            self.cell_size = cell_size
+            self.load_images()
+            self.refresh(layout=True)
 
+    @profiled("CardFace.render")
     def render(self) -> RenderableType:
-        pixels = Pixels.from_image_path(self.image_path)
-        return pixels
+        return self.front if self.face_up else self.back
 
 
 class CardGrid(Grid):
@@ -43,20 +96,57 @@ class CardGrid(Grid):
         self.styles.grid_size_rows = self.height
         self.styles.grid_size_columns = self.width
         self.matched_cards = matched_cards
+        self.card_size = DEFAULT_CARD_SIZE
+        self.cards = [
+            Card(self.card_symbols[x * self.width + y], (x, y), classes="card")
+            for x in range(self.height)
+            for y in range(self.width)
+        ]
 
     def compose(self):
-        for x in range(self.height):
-            for y in range(self.width):
-                position = x * self.width + y
-                yield Card(self.card_symbols[position], (x, y), classes="card")
+        yield from self.cards
+
+    def flip_card(self, position: int) -> None:
+        self.cards[position].flip()
+
+    def set_symbol(self, position: int, symbol: str) -> None:
+        self.card_symbols[position] = symbol
+        self.cards[position].set_symbol(symbol)
+
+    @property
+    def board_size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    def deal(self, symbols: list[str]) -> None:
+        """Start a new game on the same board, reusing the card widgets."""
+        self.card_symbols = symbols
+        self.matched_cards = []
+        for card, symbol in zip(self.cards, symbols):
+            card.reset(symbol)
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Scale the cards to the width of the board and the screen height below its top."""
+        height = (
+            self.screen.scrollable_content_region.height
+            - self.virtual_region.y
+            - BOARD_FOOTER_ROWS
+        )
+        self.set_card_size(fit_card_size(self.width, self.height, event.size.width, height))
+
+    def set_card_size(self, card_size: CellSize) -> None:
+        if card_size == self.card_size:
+            return
+        logger.debug("Resizing cards to %dx%d cells", *card_size)
+        self.card_size = card_size
+        for card in self.cards:
+            card.set_size(card_size)
 
     def on_mount(self):
         """When loading the game from saved state, update matched cards."""
         if self.matched_cards:
-            for index, card in enumerate(cast("list[Card]", self.query("Card.card"))):
-                logger.info(f"Card {index}: {card.symbol}")
+            logger.debug("Showing %d matched cards", sum(self.matched_cards))
+            for index, card in enumerate(self.cards):
                 if self.matched_cards[index]:
-                    card.is_matched = True
                     card.flip()
 
 
@@ -68,18 +158,30 @@ class Card(Button):
         self.symbol = symbol
         self.position = position
         self.is_flipped = False
-        self.is_matched = False
+        self.face = CardFace(symbol)
 
     def compose(self) -> ComposeResult:
-        yield ImageWidget(DEFAULT_IMAGE)
+        yield self.face
+
+    def set_symbol(self, symbol: str) -> None:
+        """Change the front image, for cards dealt before their symbol was known."""
+        self.symbol = symbol
+        self.face.set_symbol(symbol)
+
+    def reset(self, symbol: str) -> None:
+        """Turn the card face down with a new symbol, only face up cards are repainted."""
+        self.is_flipped = False
+        self.face.face_up = False
+        if symbol != self.symbol:
+            self.symbol = symbol
+            self.face.set_symbol(symbol)
+
+    def set_size(self, card_size: CellSize) -> None:
+        self.styles.width, self.styles.height = card_size
+        self.face.set_cell_size(card_size)
 
+    @profiled("Card.flip")
     def flip(self):
-        """Flip the card to show its symbol."""
+        """Flip the card to show its symbol, only the face is repainted."""
         self.is_flipped = not self.is_flipped
-        images = self.query("ImageWidget")
-        if images:
-            images.last().remove()
-        if self.is_flipped:
-            self.mount(ImageWidget(self.symbol))
-        else:
-            self.mount(ImageWidget(DEFAULT_IMAGE))
+        self.face.face_up = self.is_flipped
@@ -1,9 +1,11 @@
+import asyncio
 import logging
+import time
+from datetime import datetime
 from pathlib import Path
-from random import sample, shuffle
-from typing import cast
+from random import Random
+from typing import Sequence, cast
 
-from pyfiglet import figlet_format
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, Grid, Vertical
@@ -11,61 +13,129 @@ from textual.events import Mount
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Label, Static
 
+from memory_game.ai.computer_player import DIFFICULTIES, ComputerPlayer
+from memory_game.banners import banner
 from memory_game.config_prompt.config_prompt_screen import ConfigPromptScreen
-from memory_game.game_over.game_over_screen import GameOverScreen
+from memory_game.engine.game_engine import (
+    DEFAULT_PLAYERS,
+    CardFlipped,
+    CardsHidden,
+    GameEngine,
+    GameEvent,
+    GameOver,
+    PairMatched,
+    PairMissed,
+    TurnChanged,
+    symbol_from_name,
+    symbol_name,
+)
+from memory_game.game_over.game_over_screen import GameOverScreen, rank_players
+from memory_game.game_saver.game_journal import (
+    GameJournal,
+    TurnRecord,
+    compact_turns_from_config,
+)
 from memory_game.game_saver.game_save_manager import (
     BoardState,
     CardsState,
     GameSaveManager,
     GameState,
     PlayersState,
-    PlayerState,
 )
+from memory_game.game_saver.save_slots import SaveSlots
 from memory_game.gameplay.cards import Card, CardGrid
+from memory_game.gameplay.image_cache import DEFAULT_IMAGE
+from memory_game.gameplay.virtual_card_grid import VirtualCardGrid
+from memory_game.load_game.load_game_screen import LoadGameScreen
+from memory_game.network.client import DEFAULT_ROOM, HIDDEN_SYMBOL, GameClient, RemoteEngine
+from memory_game.profiling.profile_overlay import ProfileOverlay
+from memory_game.profiling.profiler import profiled, profiler
+from memory_game.replay.replay_log import (
+    DEFAULT_REPLAY_FILE,
+    ReplayRecorder,
+    fast_forward,
+    play_back,
+    read_replay,
+    turn_start,
+)
+from memory_game.stats.leaderboard_screen import LeaderboardScreen
+from memory_game.stats.stats_store import GameResult, StatsStore
 
 logger = logging.getLogger(__name__)
 
+# larger boards are drawn by VirtualCardGrid instead of a widget per card
+MAX_WIDGET_CARDS = 36
+# pauses letting human players follow computer moves, in seconds
+COMPUTER_FLIP_DELAY = 0.6
+COMPUTER_RESOLVE_DELAY = 1.2
+# scores of more players wrap to the next row of the score table
+SCORE_TABLE_COLUMNS = 4
+
 
 class ScoreBoard(Vertical):
-    """Display player scores and who's turn it is."""
+    """Display player scores and who's turn it is.
+
+    Every player has a label in the score table. A score or turn change updates only
+    the labels of the players involved, the table is rebuilt only when the number of
+    players changes.
+    """
 
     def __init__(self):
         super().__init__()
-        self.player1_score = 0
-        self.player2_score = 0
+        self.scores = [0] * DEFAULT_PLAYERS
         self.current_player = 1
+        self.score_labels: list[Label] = []
 
     def compose(self) -> ComposeResult:
+        self.score_labels = self.create_score_labels()
         with Vertical(id="score-container"):
             yield Static("Score:", classes="score")
-            yield Label(
-                f"Player 1: {self.player1_score} | Player 2: {self.player2_score}",
-                classes="score",
-            )
+            with Grid(id="score-table"):
+                yield from self.score_labels
         yield Label(f"Current Player: {self.current_player}", id="current-player")
 
-    def load_attributes_from_file(
-        self, player1_score: int, player2_score: int, current_player: int
-    ):
+    def create_score_labels(self) -> list[Label]:
+        labels = [
+            Label(f"Player {player}: {score}", classes="score player-score")
+            for player, score in enumerate(self.scores, start=1)
+        ]
+        labels[self.current_player - 1].add_class("current")
+        return labels
+
+    def on_mount(self) -> None:
+        self.resize_table()
+
+    def resize_table(self) -> None:
+        table = self.query_one("#score-table", Grid)
+        table.styles.grid_size_columns = min(len(self.scores), SCORE_TABLE_COLUMNS)
+
+    def load_attributes_from_file(self, scores: Sequence[int], current_player: int):
         """Load attributes from file."""
-        self.player1_score = player1_score
-        self.player2_score = player2_score
-        self.current_player = current_player
-        self.query_one(Label).update(
-            f"Player 1: {self.player1_score} | Player 2: {self.player2_score}"
-        )
-        cast(Label, self.query_one("#current-player")).update(
-            f"Current Player: {self.current_player}"
-        )
+        if len(scores) != len(self.scores):
+            self.scores = list(scores)
+            self.current_player = current_player
+            self.query_one("#score-table", Grid).remove_children()
+            self.score_labels = self.create_score_labels()
+            self.query_one("#score-table", Grid).mount_all(self.score_labels)
+            self.resize_table()
+            # the new labels already highlight the current player, only the label is left
+            self.query_one("#current-player", Label).update(
+                f"Current Player: {self.current_player}"
+            )
+        else:
+            for player, score in enumerate(scores, start=1):
+                if score != self.scores[player - 1]:
+                    self.set_score(player, score)
+        self.set_current_player(current_player)
+
+    def set_score(self, player: int, score: int) -> None:
+        self.scores[player - 1] = score
+        self.score_labels[player - 1].update(f"Player {player}: {score}")
 
-    def update_score(self, player: int):
+    @profiled("ScoreBoard.update_score")
+    def update_score(self, player: int, score: int):
         """Update the score for a player."""
-        if player == 1:
-            self.player1_score += 1
-        else:
-            self.player2_score += 1
-        label = self.query_one(Label)
-        label.update(f"Player 1: {self.player1_score} | Player 2: {self.player2_score}")
+        self.set_score(player, score)
 
         score_container = self.query_one("#score-container")
         score_container.styles.animate(
@@ -79,9 +149,13 @@ class ScoreBoard(Vertical):
             duration=0.5,
         )
 
-    def switch_player(self):
-        """Switch to the other player."""
-        self.current_player = 3 - self.current_player  # Switches between 1 and 2
+    def set_current_player(self, player: int):
+        """Show whose turn it is."""
+        if player == self.current_player:
+            return
+        self.score_labels[self.current_player - 1].remove_class("current")
+        self.score_labels[player - 1].add_class("current")
+        self.current_player = player
         cast(Label, self.query_one("#current-player")).update(
             f"Current Player: {self.current_player}"
         )
@@ -94,23 +168,47 @@ class GameplayScreen(Screen):
     BINDINGS = [
         ("ctrl+q", "quit", "Quit the game"),
         ("s", "save", "Save the game"),
+        ("ctrl+s", "save_slot", "Save to a new slot"),
+        ("l", "load_slot", "Load a saved slot"),
+        ("r", "rematch", "Rematch"),
+        ("n", "new_game", "New game"),
+        ("t", "leaderboard", "Leaderboard"),
     ]
 
-    def __init__(self, config: dict[str, str]):
+    def __init__(
+        self,
+        config: dict[str, str],
+        save_manager: GameSaveManager,
+        load_manager: GameSaveManager,
+        save_slots: SaveSlots,
+        stats_store: StatsStore,
+    ):
         super().__init__()
         self.config = config
+        self.save_manager = save_manager
+        self.load_manager = load_manager
+        self.save_slots = save_slots
+        self.stats_store = stats_store
         self.board_height = 0
         self.board_width = 0
-        self.flipped_cards: list[Card] = []
-        self.can_flip = True
+        self.players = DEFAULT_PLAYERS
+        self.engine: GameEngine | None = None
+        self.grid: CardGrid | VirtualCardGrid | None = None
+        self.journal: GameJournal | None = None
+        self.computer_players: dict[int, ComputerPlayer] = {}
+        self.recorder: ReplayRecorder | None = None
+        # monotonic time the game on the board was dealt, loaded or joined
+        self.game_started = 0.0
 
     def compose(self) -> ComposeResult:
         logger.debug("Composing screen...")
         yield Header()
         with Grid(id="header"):
-            yield Static(figlet_format("Memory\nGame", font="big"), id="game-title")
+            yield Static(banner("title"), id="game-title")
             yield Static(f"Board Size: {self.board_height}x{self.board_width}", id="board-size")
             yield ScoreBoard()
+        if profiler.enabled:
+            yield ProfileOverlay(id="profile-overlay")
         yield Footer()
 
     @on(Mount)
@@ -118,39 +216,39 @@ class GameplayScreen(Screen):
         """Load game state from saved file."""
         self.title = "Memory Game"
 
+        if self.replaying:
+            self.play_replay()
+            return
+
+        if self.config.get("server"):
+            self.join_server()
+            return
+
         if self.config.get("load") != "true":
             # User has not chosen to load a game, start a new one
             self.configure_game()
             return
 
-        logger.debug("Loading game state from file...")
+        self.restore_game()
 
-        save_manager = GameSaveManager(
-            self.config.get(
-                "game_load_file", "game_save.dat"
-            ),  # if user did not specify a load file parameter, use default
-            self.config.get("key_load_file", "save.key"),
-        )
-        if game_state := save_manager.load_game():
-            self.update_board_size(game_state.board.width, game_state.board.height)
-
-            # udpate scoreboard
-            scoreboard = self.query_one(ScoreBoard)
-            scoreboard.load_attributes_from_file(
-                game_state.players.player1.score,
-                game_state.players.player2.score,
-                game_state.players.current_player,
-            )
+    @work(exclusive=True, group="save-game")
+    async def restore_game(self) -> None:
+        """Read and decrypt the saved game in a worker thread, then build the board."""
+        logger.debug("Loading game state from file...")
+        self.app.notify("Loading game...", timeout=2)
 
-            self.card_symbols = game_state.cards.all_cards
-            grid = CardGrid(
-                self.board_width,
-                self.board_height,
-                self.card_symbols,
-                game_state.cards.matched_cards,
-            )
+        try:
+            game_state = await self.load_manager.load_game_async()
+            if game_state:
+                # turns autosaved after the last snapshot
+                journal = GameJournal(self.load_manager)
+                game_state = await asyncio.to_thread(journal.replay, game_state)
+        except OSError as e:
+            logger.error("Could not read saved game: %s", e)
+            game_state = None
 
-            self.mount(grid)
+        if game_state:
+            self.show_game_state(game_state)
 
             # Game state loaded, no need to start a new game
             self.app.notify("Game state loaded", timeout=5)
@@ -161,20 +259,147 @@ class GameplayScreen(Screen):
             self.app.notify("Could not load game state, starting a new game...", timeout=5)
             self.configure_game()
 
+    @property
+    def replaying(self) -> bool:
+        return self.config.get("replay") == "true"
+
+    @work(exclusive=True, group="replay")
+    async def play_replay(self) -> None:
+        """Fast-forward the recorded game to the start flip, then play the rest back."""
+        replay_file = self.config.get("replay_file") or DEFAULT_REPLAY_FILE
+        try:
+            replay = await asyncio.to_thread(read_replay, replay_file)
+        except (OSError, ValueError) as e:
+            logger.error("Could not read replay %s: %s", replay_file, e)
+            self.app.notify(f"Could not read replay: {e}", severity="error", timeout=10)
+            return
+
+        # skipped flips only touch the engine, widgets are built once for the result
+        engine = replay.new_engine()
+        start = turn_start(min(int(self.config.get("replay_start") or 0), len(replay.flips)))
+        fast_forward(engine, replay.flips[:start])
+        self.show_board(engine)
+        self.engine = engine
+        engine.subscribe(self.on_game_event)
+
+        await play_back(engine, replay.flips[start:], float(self.config.get("replay_speed") or 1))
+        self.app.notify("Replay finished", timeout=5)
+
+    @property
+    def online(self) -> bool:
+        return isinstance(self.engine, RemoteEngine)
+
+    def plays_here(self, player: int) -> bool:
+        """The player moves with this keyboard, not a computer, replay or other client."""
+        if self.replaying or player in self.computer_players:
+            return False
+        return not isinstance(self.engine, RemoteEngine) or self.engine.seat == player
+
+    @work(exclusive=True, group="network")
+    async def join_server(self) -> None:
+        """Join a room on the game server and show the game it holds until disconnected."""
+        board = await self.app.push_screen_wait(
+            ConfigPromptScreen(
+                self.config.get("width"),
+                self.config.get("height"),
+                self.config.get("players"),
+            )
+        )
+        address = self.config["server"]
+        room = self.config.get("room") or DEFAULT_ROOM
+        try:
+            client = await GameClient.connect(address)
+        except (OSError, ValueError) as e:
+            logger.error("Could not connect to %s: %s", address, e)
+            self.app.notify(f"Could not connect to {address}: {e}", severity="error", timeout=10)
+            return
+
+        try:
+            engine = await client.join(
+                room, board["board_width"], board["board_height"], board["players"]
+            )
+            self.show_board(engine)
+            self.engine = engine
+            self.game_started = time.monotonic()
+            engine.subscribe(self.on_game_event)
+            self.app.notify(f"Joined room {room} as player {engine.seat}", timeout=5)
+
+            while (message := await client.receive()) is not None:
+                if message["type"] == "error":
+                    self.app.notify(message["message"], severity="warning", timeout=3)
+                elif engine.apply(message) is None and not engine.started:
+                    waiting = engine.players - len(engine.connected)
+                    self.app.notify(f"Waiting for {waiting} more players...", timeout=3)
+        except (OSError, ValueError) as e:
+            logger.error("Game server connection failed: %s", e)
+            self.app.notify(f"Game server error: {e}", severity="error", timeout=10)
+            return
+        finally:
+            await client.close()
+        self.app.notify("Disconnected from the game server", severity="error", timeout=10)
+
+    def show_game_state(self, game_state: GameState) -> None:
+        """Replace the current board with a loaded game."""
+        engine = GameEngine(
+            game_state.board.width,
+            game_state.board.height,
+            [symbol_from_name(symbol) for symbol in game_state.cards.all_cards],
+            matched=game_state.cards.matched_cards,
+            scores=game_state.players.scores,
+            current_player=game_state.players.current_player,
+            turns=game_state.turns,
+        )
+        self.show_board(engine)
+        self.start_engine(engine)
+
+    def show_board(self, engine: GameEngine) -> None:
+        """Replace the current board with the cards and scores of the engine."""
+        self.clear_board()
+        self.update_board_size(engine.width, engine.height)
+
+        # udpate scoreboard
+        scoreboard = self.query_one(ScoreBoard)
+        scoreboard.load_attributes_from_file(engine.scores, engine.current_player)
+
+        self.card_symbols = [
+            symbol_name(symbol) if symbol != HIDDEN_SYMBOL else DEFAULT_IMAGE
+            for symbol in engine.symbols
+        ]
+        # cards flipped in the current turn are face up too, e.g. when joining mid-turn
+        flipped = set(engine.flipped)
+        self.create_grid(
+            [bool(flag) or position in flipped for position, flag in enumerate(engine.matched)]
+        )
+
+    def clear_board(self) -> None:
+        """Remove the cards and stop following the engine of the previous game."""
+        self.release_engine()
+        if self.grid is not None:
+            self.grid.remove()
+            self.grid = None
+
+    def release_engine(self) -> None:
+        if self.engine is not None:
+            self.engine.unsubscribe(self.on_game_event)
+            self.engine = None
+        self.query("#button-container").remove()
+
     @work
     async def configure_game(self) -> None:
         """Configure the game based on user input."""
 
-        # prompt user for board dimensions
+        # prompt user for board dimensions and number of players
         board_dimensions = await self.app.push_screen_wait(
             ConfigPromptScreen(
                 self.config.get("width"),
                 self.config.get("height"),
+                self.config.get("players"),
             )
         )
 
         # set dimensions and display grid with cards
         self.update_board_size(board_dimensions["board_width"], board_dimensions["board_height"])
+        self.players = board_dimensions["players"]
         self.mount_grid()
 
     def update_board_size(self, board_width: int, board_height: int) -> None:
@@ -183,51 +408,277 @@ class GameplayScreen(Screen):
         board_size = self.query_one("#board-size", Static)
         board_size.update(f"Board Size: {self.board_width}x{self.board_height}")
 
+    def start_engine(self, engine: GameEngine, seed: int | None = None) -> None:
+        """Use the engine as the source of game rules and follow its events."""
+        self.engine = engine
+        self.game_started = time.monotonic()
+        self.engine.subscribe(self.on_game_event)
+        if self.config.get("record_replay") != "false":
+            self.start_recording(engine, seed)
+        self.computer_players = {
+            player: ComputerPlayer(engine, Random(), DIFFICULTIES[player_type])
+            for player in range(1, engine.players + 1)
+            if (player_type := self.config.get(f"player{player}", "human")) in DIFFICULTIES
+        }
+        if self.config.get("autosave") == "true":
+            self.start_autosave()
+        self.play_computer_turn()
+
+    def start_recording(self, engine: GameEngine, seed: int | None) -> None:
+        """Record the flips of the game, from its seed if it was dealt here."""
+        if self.recorder is None:
+            self.recorder = ReplayRecorder(self.config.get("replay_file") or DEFAULT_REPLAY_FILE)
+        try:
+            self.recorder.start(engine, seed)
+        except OSError as e:
+            logger.error("Could not record replay: %s", e)
+            self.app.notify(f"Replay recording disabled: {e}", severity="error", timeout=10)
+
+    @work(exclusive=True, group="computer-player")
+    async def play_computer_turn(self) -> None:
+        """Let computer players move while it is their turn, with pauses to follow the game."""
+        engine = self.engine
+        while engine is self.engine and engine is not None and not engine.is_over:
+            player = self.computer_players.get(engine.current_player)
+            if player is None or engine.awaiting_resolve:
+                # a human player moves next, or has to press "Next player" first
+                return
+
+            for _ in range(2):
+                await asyncio.sleep(COMPUTER_FLIP_DELAY)
+                engine.flip(player.choose_card())
+
+            if engine.awaiting_resolve:
+                await asyncio.sleep(COMPUTER_RESOLVE_DELAY)
+                engine.resolve()
+
+    @work(exclusive=True, group="autosave")
+    async def start_autosave(self) -> None:
+        """Open the journal next to the save file and store the starting snapshot."""
+        try:
+            # a rematch keeps writing through the journal of the previous game
+            journal = self.journal or GameJournal(
+                self.save_manager, compact_turns_from_config(self.config)
+            )
+            await journal.compact_async(self.snapshot_game_state())
+        except OSError as e:
+            logger.error("Could not start autosave: %s", e)
+            self.app.notify(f"Autosave disabled: {e}", severity="error", timeout=10)
+            return
+
+        self.journal = journal
+
+    @work(group="autosave")
+    async def autosave_turn(self, record: TurnRecord) -> None:
+        """Append the turn to the journal, compacting it every few turns."""
+        if self.journal is None:
+            return
+
+        try:
+            if record.turn % self.journal.compact_turns == 0:
+                await self.journal.compact_async(self.snapshot_game_state())
+            else:
+                await self.journal.append_async(record)
+        except OSError as e:
+            logger.error("Autosave failed: %s", e)
+            self.app.notify(f"Autosave failed: {e}", severity="error", timeout=10)
+
     def mount_grid(self) -> None:
-        """Generate cards by choosing images from 1 to 18.
-        Then double the list and shuffle to place them randomly in the grid layout."""
-        self.card_symbols = sample(
-            [f"{i}.png" for i in range(1, 19)],
-            int((self.board_width * self.board_height) / 2),
+        """Deal a new game and place its cards in the grid layout.
+
+        When the board of the previous game has the same size, its cards are dealt
+        again instead of mounting new widgets.
+        """
+        # the seed is recorded, so the deal can be reproduced from the replay file
+        seed = Random().getrandbits(64)
+        engine = GameEngine.new_game(
+            self.board_width, self.board_height, Random(seed), self.players
         )
-        self.card_symbols.extend(self.card_symbols)
-        shuffle(self.card_symbols)
+        self.card_symbols = [symbol_name(symbol) for symbol in engine.symbols]
+        if (
+            self.grid is not None
+            and type(self.grid) is self.grid_class()
+            and self.grid.board_size == (self.board_width, self.board_height)
+        ):
+            self.release_engine()
+            self.grid.deal(self.card_symbols)
+        else:
+            self.clear_board()
+            self.create_grid()
 
-        grid = CardGrid(self.board_width, self.board_height, self.card_symbols)
-        self.mount(grid)
+        self.start_engine(engine, seed)
+        self.query_one(ScoreBoard).load_attributes_from_file(
+            engine.scores, engine.current_player
+        )
 
-    def action_save(self) -> None:
-        save_manager = GameSaveManager(
-            self.config.get(
-                "game_save_file", "game_save.dat"
-            ),  # save to specific path if specified in config file
-            self.config.get("key_save_file", "save.key"),
+    def grid_class(self) -> type[CardGrid] | type[VirtualCardGrid]:
+        """Widgets per card for small boards, a single virtualized widget for large ones."""
+        if self.board_width * self.board_height <= MAX_WIDGET_CARDS:
+            return CardGrid
+        return VirtualCardGrid
+
+    def create_grid(self, matched_cards: list[bool] = []) -> None:
+        self.grid = self.grid_class()(
+            self.board_width, self.board_height, self.card_symbols, matched_cards
         )
-        scoreboard = self.query_one(ScoreBoard)
-        all_cards = cast("list[Card]", self.query("Card.card"))
-        game_state = GameState(
+        self.mount(self.grid)
+
+    def action_rematch(self) -> None:
+        """Play again with the same board size and players, the cards are reshuffled."""
+        if self.engine is None or self.online or self.replaying:
+            return
+        self.mount_grid()
+        self.app.notify("New game started", timeout=2)
+
+    def action_new_game(self) -> None:
+        """Ask for the board size and players of the next game."""
+        if self.engine is None or self.online or self.replaying:
+            return
+        self.configure_game()
+
+    def after_game_over(self, choice: str | None) -> None:
+        if choice == "rematch":
+            self.action_rematch()
+        elif choice == "new_game":
+            self.action_new_game()
+        elif choice == "leaderboard":
+            self.action_leaderboard()
+
+    def action_leaderboard(self) -> None:
+        board = (self.board_width, self.board_height) if self.engine is not None else None
+        self.app.push_screen(LeaderboardScreen(self.stats_store, board))
+
+    def record_result(self, scores: Sequence[int]) -> None:
+        """Queue the finished game for the stats store, replays are not recorded."""
+        if self.engine is None or self.replaying or self.config.get("record_stats") == "false":
+            return
+
+        winners = [player for rank, player, _ in rank_players(scores) if rank == 1]
+        self.stats_store.record(
+            GameResult(
+                width=self.engine.width,
+                height=self.engine.height,
+                scores=list(scores),
+                turns=self.engine.turns,
+                duration=time.monotonic() - self.game_started,
+                winner=winners[0] if len(winners) == 1 else None,
+                player_types=[self.player_type(player) for player in range(1, len(scores) + 1)],
+            )
+        )
+
+    def player_type(self, player: int) -> str:
+        if isinstance(self.engine, RemoteEngine):
+            return "human" if player == self.engine.seat else "remote"
+        player_type = self.config.get(f"player{player}", "human")
+        return player_type if player_type in DIFFICULTIES else "human"
+
+    def snapshot_game_state(self) -> GameState:
+        """Current game as a save state, taken on the event loop."""
+        assert self.engine is not None
+        return GameState(
             board=BoardState(width=self.board_width, height=self.board_height),
             players=PlayersState(
-                player1=PlayerState(score=scoreboard.player1_score),
-                player2=PlayerState(score=scoreboard.player2_score),
-                current_player=scoreboard.current_player,
+                scores=list(self.engine.scores), current_player=self.engine.current_player
             ),
             cards=CardsState(
                 all_cards=self.card_symbols,
-                matched_cards=[card.is_matched for card in all_cards],
+                matched_cards=[bool(flag) for flag in self.engine.matched_snapshot()],
             ),
+            turns=self.engine.turns,
         )
-        saved_file, key_file = save_manager.save_game(game_state)
-        self.app.notify(f"Game saved to {saved_file}\n Key saved to {key_file}", timeout=10)
+
+    def action_save(self) -> None:
+        if self.engine is None or self.online or self.replaying:
+            return
+
+        # serializing and writing happen in a thread
+        self.save_game(self.snapshot_game_state())
+
+    @work(exclusive=True, group="save-game")
+    async def save_game(self, game_state: GameState) -> None:
+        """Save the game without blocking the UI."""
+        self.app.notify("Saving game...", timeout=2)
+        try:
+            saved_file, key_file = await self.save_manager.save_game_async(game_state)
+        except OSError as e:
+            logger.error("Could not save game: %s", e)
+            self.app.notify(f"Could not save game: {e}", severity="error", timeout=10)
+            return
+
+        message = f"Game saved to {saved_file}"
+        if self.save_manager.codec.cipher != "none":
+            message += f"\n Key saved to {key_file}"
+        self.app.notify(message, timeout=10)
+
+    def action_save_slot(self) -> None:
+        if self.engine is None or self.online or self.replaying:
+            return
+
+        slot_name = datetime.now().strftime("save-%Y%m%d-%H%M%S")
+        self.save_to_slot(slot_name, self.snapshot_game_state())
+
+    @work(group="save-slot")
+    async def save_to_slot(self, slot_name: str, game_state: GameState) -> None:
+        """Save to a new slot, every save in the same second gets a slot of its own."""
+        self.app.notify("Saving game to a new slot...", timeout=2)
+        try:
+            slot_name, saved_file = await asyncio.to_thread(
+                self.save_slots.save_new, slot_name, game_state
+            )
+        except OSError as e:
+            logger.error("Could not save game to slot %s: %s", slot_name, e)
+            self.app.notify(f"Could not save game: {e}", severity="error", timeout=10)
+            return
+
+        self.app.notify(f"Game saved to slot {slot_name} ({saved_file})", timeout=10)
+
+    @work(exclusive=True, group="load-slot")
+    async def action_load_slot(self) -> None:
+        """Pick a slot from the index, then decrypt only that slot."""
+        if self.online or self.replaying:
+            return
+        slots = await asyncio.to_thread(self.save_slots.list_slots)
+        slot_name = await self.app.push_screen_wait(LoadGameScreen(slots))
+        if slot_name is None:
+            return
+
+        try:
+            game_state = await asyncio.to_thread(self.save_slots.load, slot_name)
+        except OSError as e:
+            logger.error("Could not read save slot %s: %s", slot_name, e)
+            game_state = None
+
+        if game_state is None:
+            self.app.notify(f"Could not load slot {slot_name}", severity="error", timeout=10)
+            return
+
+        self.show_game_state(game_state)
+        self.app.notify(f"Game loaded from slot {slot_name}", timeout=5)
 
     def action_quit(self) -> None:
         self.app.exit()
 
     @on(Button.Pressed, ".card")
-    async def on_button_pressed(self, event: Button.Pressed) -> None:
+    @profiled("GameplayScreen.on_button_pressed")
+    def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle presses on cards."""
-
-        if not self.can_flip:
+        card = event.button
+        if isinstance(card, Card):
+            row, column = card.position
+            self.select_card(row * self.board_width + column)
+
+    @on(VirtualCardGrid.CardSelected)
+    @profiled("GameplayScreen.on_card_selected")
+    def on_card_selected(self, event: VirtualCardGrid.CardSelected) -> None:
+        self.select_card(event.position)
+
+    def select_card(self, position: int) -> None:
+        """Flip the card at the position if the rules allow it."""
+        if (
+            self.engine is None
+            or not self.plays_here(self.engine.current_player)
+            or not self.engine.can_flip(position)
+        ):
             return
 
         # when new card is pressed, animate score container to go back to its default color
@@ -243,53 +694,68 @@ class GameplayScreen(Screen):
             duration=0.5,
         )
 
-        card = event.button
-        if isinstance(card, Card) and not card.is_flipped and not card.is_matched:
-            card.flip()
-            self.flipped_cards.append(card)
-
-            if len(self.flipped_cards) == 2:
-                self.can_flip = False
-                await self.check_match()
+        self.engine.flip(position)
 
-    async def check_match(self) -> None:
-        """Check if the two flipped cards match."""
-        card1, card2 = self.flipped_cards
-        scoreboard = self.query_one(ScoreBoard)
+    @profiled("GameplayScreen.on_game_event")
+    def on_game_event(self, event: GameEvent) -> None:
+        """Update widgets to reflect what happened in the game engine."""
+        if self.grid is None:
+            return
 
-        if card1.symbol == card2.symbol:
-            card1.is_matched = card2.is_matched = True
-            scoreboard.update_score(scoreboard.current_player)
-            self.flipped_cards = []
-            self.can_flip = True
+        if isinstance(event, CardFlipped):
+            if self.card_symbols[event.position] == DEFAULT_IMAGE:
+                # a network game shows the symbol only once the server flipped the card
+                self.grid.set_symbol(event.position, symbol_name(event.symbol))
+            self.grid.flip_card(event.position)
+
+        elif isinstance(event, PairMatched):
+            self.query_one(ScoreBoard).update_score(event.player, event.score)
+            self.record_turn(event.first, event.second, event.player, matched=True)
+
+        elif isinstance(event, PairMissed):
+            self.record_turn(event.first, event.second, event.player, matched=False)
+            if self.plays_here(event.player):
+                button_container = Container(
+                    Button("Next player", id="next-button"), id="button-container"
+                )
+                self.mount(button_container)
+
+        elif isinstance(event, TurnChanged):
+            self.query_one(ScoreBoard).set_current_player(event.player)
+
+        elif isinstance(event, CardsHidden):
+            # in a network game the next player may flip before "Next player" is pressed
+            self.query("#button-container").remove()
+            self.grid.flip_card(event.first)
+            self.grid.flip_card(event.second)
+
+        elif isinstance(event, GameOver):
+            self.record_result(event.scores)
+            self.app.push_screen(GameOverScreen(event.scores), self.after_game_over)
+
+    def record_turn(self, first: int, second: int, player: int, matched: bool) -> None:
+        if self.journal is None or self.engine is None:
+            return
 
-            # check is game over
-            await self.check_game_over()
+        record = TurnRecord(
+            turn=self.engine.turns,
+            first=first,
+            second=second,
+            matched=matched,
+            player=player,
+            score_delta=int(matched),
+        )
+        self.autosave_turn(record)
 
-        else:
-            button_container = Container(
-                Button("Next player", id="next-button"), id="button-container"
-            )
-            self.mount(button_container)
-            scoreboard.switch_player()
-
-    async def check_game_over(self) -> None:
-        """Check if the game is over."""
-        cards = cast("list[Card]", self.query("Card.card"))
-        matched_cards = [True if card.is_matched else False for card in cards]
-        if all(matched_cards):
-            scoreboard = self.query_one(ScoreBoard)
-            self.app.push_screen(
-                GameOverScreen(scoreboard.player1_score, scoreboard.player2_score)
-            )
+    def on_unmount(self) -> None:
+        if self.journal is not None:
+            self.journal.close()
+        if self.recorder is not None:
+            self.recorder.stop()
 
     @on(Button.Pressed, "#next-button")
     def next_player_turn(self) -> None:
         self.query_one("#button-container").remove()
-
-        card1, card2 = self.flipped_cards
-        card1.flip()
-        card2.flip()
-
-        self.flipped_cards = []
-        self.can_flip = True
+        if self.engine is not None:
+            self.engine.resolve()
+            self.play_computer_turn()
@@ -0,0 +1,116 @@
+import colorsys
+import logging
+from collections import OrderedDict
+from random import Random
+from typing import TYPE_CHECKING
+
+from rich.console import RenderableType
+
+from memory_game.engine.game_engine import GENERATED_SYMBOL_PREFIX, symbol_from_name
+from memory_game.gameplay.card_renderers import RENDERERS, CardRenderer, CellSize
+from memory_game.gameplay.renderer_names import DEFAULT_RENDERER
+from memory_game.gameplay.sprite_atlas import sprite_atlas
+
+if TYPE_CHECKING:
+    # PIL and rich_pixels are imported when the first image is decoded
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMAGE = "question_mark.png"
+CARD_IMAGES = [f"{i}.png" for i in range(1, 19)]
+CACHE_SIZE = 256  # enough for every symbol of the largest board
+IMAGE_SIZE = 12
+# one pixel per column, two per row as drawn by the half-block renderer
+NATIVE_CELL_SIZE: CellSize = (IMAGE_SIZE, IMAGE_SIZE // 2)
+GOLDEN_RATIO = 0.618033988749895
+
+
+class ImageCache:
+    """Bounded LRU cache of card images drawn by the renderer, shared by all card widgets.
+
+    Images are cached per size in cells, so every card size is scaled once.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.renderer: CardRenderer = RENDERERS[DEFAULT_RENDERER]
+        self._images: OrderedDict[tuple[str, CellSize], RenderableType] = OrderedDict()
+
+    def set_renderer(self, name: str) -> None:
+        """Draw images with another backend from now on."""
+        renderer = RENDERERS[name]
+        if renderer is not self.renderer:
+            self.renderer = renderer
+            self.clear()
+
+    def get(self, image_name: str, cell_size: CellSize = NATIVE_CELL_SIZE) -> RenderableType:
+        """Return drawn image, reading it from disk only on the first request."""
+        key = (image_name, cell_size)
+        pixels = self._images.get(key)
+        if pixels is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return pixels
+
+        self.misses += 1
+        pixels = self._load(image_name, cell_size)
+        self._images[key] = pixels
+        if len(self._images) > self.maxsize:
+            self._images.popitem(last=False)
+        return pixels
+
+    def warm(self, cell_size: CellSize = NATIVE_CELL_SIZE) -> None:
+        """Decode all card faces up front, so rendering never touches the filesystem."""
+        for image_name in [DEFAULT_IMAGE, *CARD_IMAGES]:
+            self.get(image_name, cell_size)
+        logger.info("Image cache warmed with %d images", len(self._images))
+
+    def clear(self) -> None:
+        self._images.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return cache counters, useful to check that repaints are cache hits only."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._images),
+            "maxsize": self.maxsize,
+        }
+
+    def _load(self, image_name: str, cell_size: CellSize) -> RenderableType:
+        if image_name.startswith(GENERATED_SYMBOL_PREFIX):
+            image = generate_symbol_image(symbol_from_name(image_name))
+        else:
+            image = sprite_atlas.get(image_name)
+        return self.renderer.render(image, cell_size)
+
+
+def generate_symbol_image(symbol: int) -> "Image.Image":
+    """Draw a mirrored block pattern in a color derived from the symbol.
+
+    Used for boards with more pairs than there are image files.
+    """
+    from PIL import Image
+
+    rng = Random(symbol)
+    hue = (symbol * GOLDEN_RATIO) % 1
+    red, green, blue = (int(value * 255) for value in colorsys.hsv_to_rgb(hue, 0.8, 0.95))
+
+    image = Image.new("RGBA", (IMAGE_SIZE, IMAGE_SIZE), (0, 0, 0, 0))
+    block = 2
+    blocks = IMAGE_SIZE // block
+    for y in range(blocks):
+        for x in range((blocks + 1) // 2):
+            if rng.getrandbits(1):
+                for column in {x, blocks - 1 - x}:
+                    box = (column * block, y * block, (column + 1) * block, (y + 1) * block)
+                    image.paste((red, green, blue, 255), box)
+    return image
+
+
+image_cache = ImageCache()
@@ -0,0 +1,7 @@
+"""Names of the card renderers, importable without rich or the game's widgets."""
+
+HALFBLOCK = "halfblock"
+GLYPH = "glyph"
+ASCII = "ascii"
+RENDERER_NAMES = (ASCII, GLYPH, HALFBLOCK)
+DEFAULT_RENDERER = HALFBLOCK
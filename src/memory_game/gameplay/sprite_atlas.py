@@ -0,0 +1,106 @@
+"""Sprite atlas with all card faces packed into one file.
+
+The atlas is built from `assets/images/*.png` with:
+
+    python -m memory_game.gameplay.sprite_atlas
+
+File layout: magic, little-endian uint32 length of a JSON index, the index, then
+raw RGBA pixels of every image one after another. The index maps image names to
+the offset, width and height of their pixels.
+"""
+
+import json
+import logging
+import mmap
+import struct
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+ATLAS_MAGIC = b"MGATLAS1"
+ATLAS_FILE = "atlas.bin"
+ASSETS_DIR = Path(__file__).parent.parent / "assets"
+HEADER = struct.Struct(f"<{len(ATLAS_MAGIC)}sI")
+
+
+class SpriteAtlas:
+    """Card faces read from the packed atlas, opened on first use.
+
+    When the atlas is a regular file it is memory-mapped and every image is a
+    zero-copy view into the mapping, otherwise (e.g. zipped installs) the file
+    is read once into memory.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: memoryview | None = None
+        self._index: dict[str, tuple[int, int, int]] = {}
+
+    def _open(self) -> memoryview:
+        atlas = resources.files("memory_game") / "assets" / ATLAS_FILE
+        if isinstance(atlas, Path):
+            with open(atlas, "rb") as f:
+                data: mmap.mmap | bytes = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = atlas.read_bytes()
+
+        buffer = memoryview(data)
+        magic, index_length = HEADER.unpack_from(buffer)
+        if magic != ATLAS_MAGIC:
+            raise ValueError(f"{ATLAS_FILE} is not a sprite atlas")
+
+        index_end = HEADER.size + index_length
+        index = json.loads(bytes(buffer[HEADER.size : index_end]))
+        self._index = {
+            name: (index_end + entry["offset"], entry["width"], entry["height"])
+            for name, entry in index.items()
+        }
+        logger.info("Sprite atlas loaded with %d images", len(self._index))
+        return buffer
+
+    def get(self, image_name: str) -> "Image.Image":
+        """Image sharing its pixels with the atlas buffer."""
+        from PIL import Image
+
+        if self._buffer is None:
+            self._buffer = self._open()
+
+        offset, width, height = self._index[image_name]
+        pixels = self._buffer[offset : offset + width * height * 4]
+        return Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+
+
+def build_atlas(images_dir: Path, atlas_path: Path) -> None:
+    """Pack every PNG from images_dir into a single atlas file."""
+    from PIL import Image
+
+    index = {}
+    pixels = bytearray()
+    for image_path in sorted(images_dir.glob("*.png")):
+        with Image.open(image_path) as image:
+            rgba = image.convert("RGBA")
+        index[image_path.name] = {
+            "offset": len(pixels),
+            "width": rgba.width,
+            "height": rgba.height,
+        }
+        pixels.extend(rgba.tobytes())
+
+    encoded_index = json.dumps(index, separators=(",", ":")).encode()
+    with open(atlas_path, "wb") as f:
+        f.write(HEADER.pack(ATLAS_MAGIC, len(encoded_index)))
+        f.write(encoded_index)
+        f.write(pixels)
+    logger.info("Packed %d images into %s", len(index), atlas_path)
+
+
+sprite_atlas = SpriteAtlas()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    build_atlas(ASSETS_DIR / "images", ASSETS_DIR / ATLAS_FILE)
@@ -0,0 +1,196 @@
+import logging
+
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from memory_game.gameplay.card_renderers import CellSize
+from memory_game.gameplay.cards import DEFAULT_CARD_SIZE, fit_card_size
+from memory_game.gameplay.image_cache import DEFAULT_IMAGE, image_cache
+from memory_game.profiling.profiler import profiled
+
+logger = logging.getLogger(__name__)
+
+GUTTER_WIDTH = 2
+GUTTER_HEIGHT = 1
+CURSOR_STYLE = Style(color="gold1", bold=True)
+
+
+class VirtualCardGrid(ScrollView, can_focus=True):
+    """A grid of cards for large boards.
+
+    No widget is created per card. Only the lines visible in the scroll viewport
+    are rendered, from card images cut into lines once per symbol, so mount time
+    and memory do not grow with the board size. Cards are scaled to the viewport
+    like those of CardGrid, boards wider than the smallest cards scroll.
+    """
+
+    BINDINGS = [
+        Binding("up", "move_cursor(0, -1)", "Up", show=False),
+        Binding("down", "move_cursor(0, 1)", "Down", show=False),
+        Binding("left", "move_cursor(-1, 0)", "Left", show=False),
+        Binding("right", "move_cursor(1, 0)", "Right", show=False),
+        Binding("enter,space", "select_card", "Flip card", show=False),
+    ]
+
+    cursor = reactive(0, repaint=False)
+
+    class CardSelected(Message):
+        """Posted when a card is clicked or selected with the keyboard."""
+
+        def __init__(self, position: int) -> None:
+            super().__init__()
+            self.position = position
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        symbols: list[str],
+        matched_cards: list[bool] = [],
+    ) -> None:
+        super().__init__()
+        self.board_width = width
+        self.board_height = height
+        self.card_symbols = symbols
+        self.face_up = bytearray(matched_cards) if matched_cards else bytearray(len(symbols))
+        self.card_size = DEFAULT_CARD_SIZE
+        self.virtual_size = Size(width * self.cell_width, height * self.cell_height)
+        self._card_lines: dict[str, list[list[Segment]]] = {}
+
+    @property
+    def cell_width(self) -> int:
+        return GUTTER_WIDTH + self.card_size[0]
+
+    @property
+    def cell_height(self) -> int:
+        return self.card_size[1] + GUTTER_HEIGHT
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Scale the cards to the viewport, every card has a gutter on its left."""
+        viewport = self.scrollable_content_region
+        self.set_card_size(
+            fit_card_size(
+                self.board_width,
+                self.board_height,
+                viewport.width - GUTTER_WIDTH,
+                viewport.height,
+            )
+        )
+
+    def set_card_size(self, card_size: CellSize) -> None:
+        if card_size == self.card_size:
+            return
+        logger.debug("Resizing cards to %dx%d cells", *card_size)
+        self.card_size = card_size
+        self._card_lines.clear()
+        self.virtual_size = Size(
+            self.board_width * self.cell_width, self.board_height * self.cell_height
+        )
+        self.refresh()
+
+    def flip_card(self, position: int) -> None:
+        """Flip the card to show or hide its symbol, only its lines are repainted."""
+        self.face_up[position] ^= 1
+        self.refresh_card(position)
+
+    @property
+    def board_size(self) -> tuple[int, int]:
+        return self.board_width, self.board_height
+
+    def deal(self, symbols: list[str]) -> None:
+        """Start a new game on the same board, all cards face down."""
+        self.card_symbols = symbols
+        self.face_up = bytearray(len(symbols))
+        self.refresh()
+
+    def set_symbol(self, position: int, symbol: str) -> None:
+        self.card_symbols[position] = symbol
+        self.refresh_card(position)
+
+    def refresh_card(self, position: int) -> None:
+        row = position // self.board_width
+        self.refresh_lines(row * self.cell_height, self.card_size[1])
+
+    def card_region(self, position: int) -> Region:
+        row, column = divmod(position, self.board_width)
+        return Region(
+            column * self.cell_width, row * self.cell_height, self.cell_width, self.card_size[1]
+        )
+
+    def card_lines(self, image_name: str) -> list[list[Segment]]:
+        """Card image cut into lines of segments, rendered once per image and card size."""
+        lines = self._card_lines.get(image_name)
+        if lines is None:
+            console = self.app.console
+            card_width, card_height = self.card_size
+            lines = console.render_lines(
+                image_cache.get(image_name, self.card_size),
+                console.options.update_width(card_width),
+                pad=False,
+            )
+            lines = Segment.set_shape(lines, card_width, card_height)
+            self._card_lines[image_name] = lines
+        return lines
+
+    @profiled("VirtualCardGrid.render_line")
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        cell_width = self.cell_width
+        row, card_line = divmod(y + scroll_y, self.cell_height)
+        if row >= self.board_height or card_line >= self.card_size[1]:
+            return Strip.blank(width, self.rich_style)
+
+        gutter = Segment(" " * GUTTER_WIDTH, self.rich_style)
+        cursor = Segment(" " * (GUTTER_WIDTH - 1) + "▐", self.rich_style + CURSOR_STYLE)
+
+        # only cards in visible columns are drawn
+        first_column = scroll_x // cell_width
+        last_column = min(self.board_width, (scroll_x + width) // cell_width + 1)
+        segments: list[Segment] = []
+        for column in range(first_column, last_column):
+            position = row * self.board_width + column
+            image_name = self.card_symbols[position] if self.face_up[position] else DEFAULT_IMAGE
+            segments.append(cursor if position == self.cursor else gutter)
+            segments.extend(self.card_lines(image_name)[card_line])
+
+        offset = scroll_x - first_column * cell_width
+        strip = Strip(segments, (last_column - first_column) * cell_width)
+        return strip.crop(offset, offset + width).extend_cell_length(width, self.rich_style)
+
+    def watch_cursor(self, old_cursor: int, new_cursor: int) -> None:
+        self.refresh_card(old_cursor)
+        self.refresh_card(new_cursor)
+        self.scroll_to_region(self.card_region(new_cursor), animate=False)
+
+    def action_move_cursor(self, columns: int, rows: int) -> None:
+        row, column = divmod(self.cursor, self.board_width)
+        row = min(max(row + rows, 0), self.board_height - 1)
+        column = min(max(column + columns, 0), self.board_width - 1)
+        self.cursor = row * self.board_width + column
+
+    def action_select_card(self) -> None:
+        self.post_message(self.CardSelected(self.cursor))
+
+    def on_click(self, event: events.Click) -> None:
+        x = event.x + self.scroll_offset.x
+        y = event.y + self.scroll_offset.y
+        column, cell_x = divmod(x, self.cell_width)
+        row, cell_y = divmod(y, self.cell_height)
+        if (
+            column >= self.board_width
+            or row >= self.board_height
+            or cell_x < GUTTER_WIDTH
+            or cell_y >= self.card_size[1]
+        ):
+            return
+
+        self.cursor = row * self.board_width + column
+        self.post_message(self.CardSelected(self.cursor))
@@ -0,0 +1,57 @@
+from datetime import datetime
+from pathlib import Path
+
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Static
+
+from memory_game.game_saver.save_slots import SlotInfo
+
+
+class LoadGameScreen(ModalScreen[str | None]):
+    """The screen listing save slots, returns the name of the chosen slot."""
+
+    CSS_PATH = Path(__file__).parent.parent / "styles" / "load_game_screen.tcss"
+    BINDINGS = [("escape", "cancel", "Cancel")]
+
+    def __init__(self, slots: list[SlotInfo]) -> None:
+        super().__init__()
+        self.slots = slots
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("Load Game", id="title"),
+            DataTable(id="slots-table", cursor_type="row", zebra_stripes=True),
+            Button("Cancel", variant="error", id="cancel-button"),
+            id="load-container",
+        )
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_columns("Slot", "Board", "Scores", "Turns", "Saved")
+        # the metadata comes from the index, no save file is opened here
+        table.add_rows(
+            [
+                (
+                    slot.name,
+                    f"{slot.width}x{slot.height}",
+                    " : ".join(str(score) for score in slot.scores),
+                    slot.turns,
+                    datetime.fromtimestamp(slot.saved_at).strftime("%Y-%m-%d %H:%M"),
+                )
+                for slot in self.slots
+            ]
+        )
+        if not self.slots:
+            self.query_one("#title", Static).update("Load Game - no saved slots")
+        table.focus()
+
+    @on(DataTable.RowSelected)
+    def select_slot(self, event: DataTable.RowSelected) -> None:
+        self.dismiss(self.slots[event.cursor_row].name)
+
+    @on(Button.Pressed, "#cancel-button")
+    def action_cancel(self) -> None:
+        self.dismiss(None)
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+
+from memory_game.engine.game_engine import (
+    CardFlipped,
+    CardsHidden,
+    GameEngine,
+    GameEvent,
+    PairMatched,
+    PairMissed,
+    TurnChanged,
+)
+from memory_game.network.protocol import (
+    Message,
+    ProtocolError,
+    encode,
+    message_to_event,
+    open_connection,
+    read_message,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOM = "lobby"
+HIDDEN_SYMBOL = 0  # symbol of a card the server has not shown yet
+
+
+class GameClient:
+    """Connection to the game server."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, address: str) -> "GameClient":
+        return cls(*await open_connection(address))
+
+    def send(self, message: Message) -> None:
+        self.writer.write(encode(message))
+
+    async def receive(self) -> Message | None:
+        """Next message from the server, None once the connection is closed."""
+        return await read_message(self.reader)
+
+    async def request(self, message: Message, reply_type: str) -> Message:
+        """Send a message and wait for the reply, skipping messages sent before it."""
+        self.send(message)
+        while (reply := await self.receive()) is not None:
+            if reply["type"] == "error":
+                raise ProtocolError(reply["message"])
+            if reply["type"] == reply_type:
+                return reply
+        raise ConnectionError("Server closed the connection")
+
+    async def join(
+        self, room: str, width: int, height: int, players: int
+    ) -> "RemoteEngine":
+        """Take a seat in the room, the board size and players are used if it is new."""
+        joined = await self.request(
+            {"type": "join", "room": room, "width": width, "height": height, "players": players},
+            "joined",
+        )
+        return RemoteEngine(self, joined)
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class RemoteEngine(GameEngine):
+    """Mirror of a game held by the server, used by views like a local engine.
+
+    Flips and resolves are sent to the server as intents. The state only changes
+    when the server's events are applied, and then the events are passed on to the
+    subscribed views. Symbols of cards that were never face up are HIDDEN_SYMBOL.
+    """
+
+    def __init__(self, client: GameClient, joined: Message) -> None:
+        super().__init__(
+            joined["width"],
+            joined["height"],
+            joined["symbols"],
+            matched=joined["matched"],
+            scores=joined["scores"],
+            current_player=joined["current_player"],
+            turns=joined["turns"],
+        )
+        self.client = client
+        self.room: str = joined["room"]
+        self.seat: int = joined["player"]
+        self.flipped = list(joined["flipped"])
+        self.connected: list[int] = [self.seat]
+
+    @property
+    def started(self) -> bool:
+        """Every seat of the room is taken, so moves are accepted."""
+        return len(self.connected) == self.players
+
+    def can_flip(self, position: int) -> bool:
+        if not self.started or self.current_player != self.seat:
+            return False
+        # the server hides a missed pair before the next flip
+        flipped = [] if self.awaiting_resolve else self.flipped
+        return len(flipped) < 2 and not self.matched[position] and position not in flipped
+
+    def flip(self, position: int) -> bool:
+        """Ask the server to flip the card, it is turned over when the server confirms."""
+        if not self.can_flip(position):
+            return False
+        self.client.send({"type": "flip", "position": position})
+        return True
+
+    def resolve(self) -> None:
+        if self.awaiting_resolve:
+            self.client.send({"type": "resolve"})
+
+    def apply(self, message: Message) -> GameEvent | None:
+        """Update the mirror with a message of the server and notify the views."""
+        if message["type"] == "seats":
+            self.connected = message["connected"]
+            return None
+
+        event = message_to_event(message)
+        if isinstance(event, CardFlipped):
+            self.symbols[event.position] = event.symbol
+            self.flipped.append(event.position)
+        elif isinstance(event, PairMatched):
+            self.matched[event.first] = self.matched[event.second] = 1
+            self.remaining_pairs -= 1
+            self.scores[event.player - 1] = event.score
+            self.flipped = []
+            self.turns += 1
+        elif isinstance(event, PairMissed):
+            self.turns += 1
+        elif isinstance(event, TurnChanged):
+            self.current_player = event.player
+        elif isinstance(event, CardsHidden):
+            self.flipped = []
+
+        if self._listeners:
+            self._emit(event)
+        return event
@@ -0,0 +1,109 @@
+"""Messages between the game server and its clients.
+
+Every message is one line of JSON with a "type" field. Game events are sent as
+messages named after the event class, with the fields of the event, so clients
+apply the same deltas the views of a local engine receive.
+
+Addresses are `host:port` for TCP, or `unix:PATH` for a Unix socket.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable
+
+from memory_game.engine.game_engine import (
+    CardFlipped,
+    CardsHidden,
+    GameEvent,
+    GameOver,
+    PairMatched,
+    PairMissed,
+    TurnChanged,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7878
+DEFAULT_ADDRESS = f"{DEFAULT_HOST}:{DEFAULT_PORT}"
+UNIX_PREFIX = "unix:"
+MAX_MESSAGE_SIZE = 64 * 1024  # a full 20x20 board takes a few kB
+
+EVENT_TYPES: dict[str, type] = {
+    event_type.__name__: event_type
+    for event_type in (CardFlipped, PairMatched, PairMissed, CardsHidden, TurnChanged, GameOver)
+}
+
+Message = dict[str, Any]
+ConnectionHandler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+class ProtocolError(ValueError):
+    """A message that is not valid JSON or does not follow the protocol."""
+
+
+def encode(message: Message) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+async def read_message(reader: asyncio.StreamReader) -> Message | None:
+    """Next message from the stream, None once the other side closed it."""
+    try:
+        line = await reader.readline()
+    except ValueError as e:
+        # the line is longer than the stream limit
+        raise ProtocolError(f"Message too long: {e}") from e
+    if not line:
+        return None
+
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"Invalid message: {e}") from e
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ProtocolError("Message must be an object with a type")
+    return message
+
+
+def event_to_message(event: GameEvent) -> Message:
+    return {"type": type(event).__name__, **vars(event)}
+
+
+def message_to_event(message: Message) -> GameEvent:
+    event_type = EVENT_TYPES.get(message["type"])
+    if event_type is None:
+        raise ProtocolError(f"Unknown message type {message['type']}")
+
+    fields = {key: value for key, value in message.items() if key != "type"}
+    if event_type is GameOver and isinstance(fields.get("scores"), list):
+        fields["scores"] = tuple(fields["scores"])
+    try:
+        return event_type(**fields)
+    except TypeError as e:
+        raise ProtocolError(f"Invalid {message['type']} message: {e}") from e
+
+
+def parse_address(address: str) -> tuple[str, int] | str:
+    """(host, port) of a TCP address, or the path of a Unix socket."""
+    if address.startswith(UNIX_PREFIX):
+        return address.removeprefix(UNIX_PREFIX)
+
+    host, _, port = address.rpartition(":")
+    if not host:
+        return address, DEFAULT_PORT
+    try:
+        return host, int(port)
+    except ValueError:
+        raise ValueError(f"Invalid port in address {address}") from None
+
+
+async def open_connection(address: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    target = parse_address(address)
+    if isinstance(target, str):
+        return await asyncio.open_unix_connection(target, limit=MAX_MESSAGE_SIZE)
+    return await asyncio.open_connection(*target, limit=MAX_MESSAGE_SIZE)
+
+
+async def start_server(handler: ConnectionHandler, address: str) -> asyncio.Server:
+    target = parse_address(address)
+    if isinstance(target, str):
+        return await asyncio.start_unix_server(handler, target, limit=MAX_MESSAGE_SIZE)
+    return await asyncio.start_server(handler, *target, limit=MAX_MESSAGE_SIZE)
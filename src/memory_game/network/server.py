@@ -0,0 +1,269 @@
+"""Game server holding the boards of many rooms in one asyncio process.
+
+Run with `memory-game serve --help` for the listening options.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from random import Random
+
+from memory_game.engine.game_engine import (
+    MAX_BOARD_SIZE,
+    MAX_PLAYERS,
+    MIN_BOARD_SIZE,
+    MIN_PLAYERS,
+    GameEngine,
+    GameEvent,
+)
+from memory_game.network.protocol import (
+    DEFAULT_ADDRESS,
+    Message,
+    ProtocolError,
+    encode,
+    event_to_message,
+    read_message,
+    start_server,
+)
+
+logger = logging.getLogger(__name__)
+
+# a client that stops reading is dropped once this many bytes wait to be sent to it
+MAX_WRITE_BUFFER = 256 * 1024
+
+
+class Room:
+    """One game: the engine deciding every move and the connections of its players.
+
+    Each event of the engine is encoded once and written to every seat, writes are
+    buffered by the transports, so a move costs no awaits besides the mover's drain.
+    """
+
+    __slots__ = ("name", "engine", "seats")
+
+    def __init__(self, name: str, engine: GameEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.seats: list[asyncio.StreamWriter | None] = [None] * engine.players
+        engine.subscribe(self.on_game_event)
+
+    @property
+    def connected(self) -> list[int]:
+        return [player for player, writer in enumerate(self.seats, start=1) if writer]
+
+    @property
+    def full(self) -> bool:
+        return None not in self.seats
+
+    def take_seat(self, writer: asyncio.StreamWriter) -> int | None:
+        """Seat the connection as the first free player, None if the room is full."""
+        for index, seat in enumerate(self.seats):
+            if seat is None:
+                self.seats[index] = writer
+                return index + 1
+        return None
+
+    def leave(self, player: int) -> None:
+        self.seats[player - 1] = None
+        # cards of a missed pair would stay face up until the player comes back
+        self.engine.resolve()
+        self.broadcast(self.seats_message())
+
+    def seats_message(self) -> Message:
+        return {"type": "seats", "connected": self.connected}
+
+    def joined_message(self, player: int) -> Message:
+        """Everything a client needs to show the board, without the hidden symbols."""
+        engine = self.engine
+        return {
+            "type": "joined",
+            "room": self.name,
+            "player": player,
+            "width": engine.width,
+            "height": engine.height,
+            "symbols": [
+                symbol if engine.matched[position] or position in engine.flipped else 0
+                for position, symbol in enumerate(engine.symbols)
+            ],
+            "matched": list(engine.matched),
+            "flipped": engine.flipped,
+            "scores": engine.scores,
+            "current_player": engine.current_player,
+            "turns": engine.turns,
+        }
+
+    def broadcast(self, message: Message) -> None:
+        data = encode(message)
+        for player, writer in enumerate(self.seats, start=1):
+            if writer is None or writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                logger.warning("Dropping player %d of room %s, not reading", player, self.name)
+                writer.close()
+                continue
+            writer.write(data)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        self.broadcast(event_to_message(event))
+
+
+class GameServer:
+    """Rooms by name, created by their first player and removed when the last one leaves.
+
+    The engines are the only copy of the boards: clients send flip and resolve
+    intents, the server checks them against the rules and sends the resulting
+    events to every player of the room.
+    """
+
+    def __init__(self, rng: Random | None = None) -> None:
+        self.rng = rng if rng is not None else Random()
+        self.rooms: dict[str, Room] = {}
+        self.connections = 0
+        self.moves = 0
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        room: Room | None = None
+        player = 0
+        try:
+            while (message := await read_message(reader)) is not None:
+                if message["type"] == "join" and room is None:
+                    room, player, reply = self.join(message, writer)
+                    writer.write(encode(reply))
+                    if room is not None:
+                        room.broadcast(room.seats_message())
+                elif (reply := self.handle(message, room, player)) is not None:
+                    writer.write(encode(reply))
+                await writer.drain()
+        except ProtocolError as e:
+            logger.warning("Closing connection: %s", e)
+        except ConnectionError as e:
+            logger.info("Connection lost: %s", e)
+        finally:
+            self.connections -= 1
+            if room is not None:
+                self.leave(room, player)
+            writer.close()
+
+    def join(
+        self, message: Message, writer: asyncio.StreamWriter
+    ) -> tuple[Room | None, int, Message]:
+        name = message.get("room")
+        if not isinstance(name, str) or not name:
+            return None, 0, error("Room name is required")
+
+        room = self.rooms.get(name)
+        if room is None:
+            try:
+                engine = self.new_engine(message)
+            except (TypeError, ValueError) as e:
+                return None, 0, error(str(e))
+            room = self.rooms[name] = Room(name, engine)
+            logger.info("Created room %s (%d rooms)", name, len(self.rooms))
+
+        player = room.take_seat(writer)
+        if player is None:
+            return None, 0, error(f"Room {name} is full")
+        return room, player, room.joined_message(player)
+
+    def new_engine(self, message: Message) -> GameEngine:
+        width = int(message.get("width", 4))
+        height = int(message.get("height", 4))
+        players = int(message.get("players", MIN_PLAYERS))
+        if not (
+            MIN_BOARD_SIZE <= width <= MAX_BOARD_SIZE
+            and MIN_BOARD_SIZE <= height <= MAX_BOARD_SIZE
+        ):
+            raise ValueError(f"Board size must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}")
+        if (width * height) % 2:
+            raise ValueError("Board size must be an even number")
+        if not MIN_PLAYERS <= players <= MAX_PLAYERS:
+            raise ValueError(f"Number of players must be between {MIN_PLAYERS} and {MAX_PLAYERS}")
+        return GameEngine.new_game(width, height, self.rng, players)
+
+    def handle(self, message: Message, room: Room | None, player: int) -> Message | None:
+        """Apply an intent of a seated player, the reply is None when it succeeded."""
+        kind = message["type"]
+        if kind == "stats":
+            return self.stats()
+        if room is None:
+            return error("Join a room first")
+
+        engine = room.engine
+        if kind == "flip":
+            position = message.get("position")
+            if not room.full:
+                return error(f"Waiting for {len(room.seats) - len(room.connected)} more players")
+            if engine.current_player != player:
+                return error("Not your turn")
+            if not isinstance(position, int) or not 0 <= position < len(engine.symbols):
+                return error(f"No card at position {position}")
+            # the next player may flip before the missed pair was hidden
+            engine.resolve()
+            if not engine.flip(position):
+                return error(f"Card {position} cannot be flipped")
+            self.moves += 1
+            return None
+        if kind == "resolve":
+            engine.resolve()
+            return None
+        if kind == "join":
+            return error(f"Already playing in room {room.name}")
+        return error(f"Unknown message type {kind}")
+
+    def leave(self, room: Room, player: int) -> None:
+        room.leave(player)
+        if not room.connected:
+            del self.rooms[room.name]
+            logger.info("Removed room %s (%d rooms)", room.name, len(self.rooms))
+
+    def stats(self) -> Message:
+        """Counters of the server, with its CPU time to measure the cost of the rooms."""
+        return {
+            "type": "stats",
+            "rooms": len(self.rooms),
+            "connections": self.connections,
+            "moves": self.moves,
+            "cpu_time": time.process_time(),
+        }
+
+
+def error(text: str) -> Message:
+    return {"type": "error", "message": text}
+
+
+async def serve(address: str) -> None:
+    game_server = GameServer()
+    server = await start_server(game_server.handle_connection, address)
+    print(f"Serving memory games on {address}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="memory-game serve", description="Host games for clients on the network"
+    )
+    parser.add_argument(
+        "--address",
+        default=DEFAULT_ADDRESS,
+        help=f"host:port, or unix:PATH for a Unix socket (default: {DEFAULT_ADDRESS})",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log rooms and connections")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    try:
+        asyncio.run(serve(args.address))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
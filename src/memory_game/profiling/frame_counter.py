@@ -0,0 +1,43 @@
+"""Count the frames Textual writes to the terminal, and their size.
+
+Textual has no public hook for written frames, so this wraps two private APIs
+of textual~=0.84: App._display, called once per frame, and the write method of
+the app's driver. Counting is skipped with a warning when a Textual version no
+longer has them, the game itself never depends on these wrappers.
+"""
+
+import logging
+from typing import Any
+
+from textual.app import App
+
+from memory_game.profiling.profiler import profiler
+
+logger = logging.getLogger(__name__)
+
+
+def count_frames(app: App) -> bool:
+    """Report every frame the app writes to the profiler, False if unsupported."""
+    display = getattr(app, "_display", None)
+    write = getattr(getattr(app, "_driver", None), "write", None)
+    if not callable(display) or not callable(write):
+        logger.warning("Frames cannot be counted with this Textual version")
+        return False
+
+    written = 0
+
+    def counting_write(data: str) -> None:
+        nonlocal written
+        written += len(data.encode())
+        write(data)
+
+    def counting_display(screen: Any, renderable: Any) -> None:
+        before = written
+        display(screen, renderable)
+        # every call with a renderable writes one frame
+        if renderable is not None:
+            profiler.frame(written - before)
+
+    setattr(app._driver, "write", counting_write)
+    setattr(app, "_display", counting_display)
+    return True
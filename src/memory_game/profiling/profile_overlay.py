@@ -0,0 +1,26 @@
+from textual.widgets import Static
+
+from memory_game.gameplay.image_cache import image_cache
+from memory_game.profiling.profiler import profiler
+
+REFRESH_INTERVAL = 0.5
+
+
+class ProfileOverlay(Static):
+    """Frames per second, their size and p50/p99 latency of the profiled hot paths."""
+
+    def on_mount(self) -> None:
+        self.update_stats()
+        self.set_interval(REFRESH_INTERVAL, self.update_stats)
+
+    def update_stats(self) -> None:
+        lines = [
+            f"FPS: {profiler.fps():.0f}  {profiler.bytes_per_frame():,.0f} bytes/frame  "
+            f"({image_cache.renderer.name} cards)"
+        ]
+        for name in sorted(profiler.timers):
+            p50, p99 = profiler.percentiles(name)
+            lines.append(
+                f"{name:<34} p50 {p50:7.2f} ms  p99 {p99:7.2f} ms  ({profiler.calls[name]})"
+            )
+        self.update("\n".join(lines))
@@ -0,0 +1,148 @@
+import cProfile
+import functools
+import inspect
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+# recent samples kept per timer, so percentiles follow what happens now
+SAMPLES_PER_TIMER = 1000
+FPS_WINDOW = 1.0
+
+
+class Profiler:
+    """Timers around hot paths and frames written, collected only with `--profile`.
+
+    While disabled a timed function costs one attribute check. Save I/O is timed in
+    worker threads; appending to a deque is thread safe, so timers need no lock.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.timers: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=SAMPLES_PER_TIMER)
+        )
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        # (timestamp, bytes written to the terminal) of the frames in the FPS window
+        self.frames: deque[tuple[float, int]] = deque()
+        self.total_frames = 0
+        self.total_bytes = 0
+        self.started = 0.0
+        self._cprofile: cProfile.Profile | None = None
+
+    def start(self, use_cprofile: bool = False) -> None:
+        self.enabled = True
+        self.started = time.perf_counter()
+        if use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def record(self, name: str, seconds: float) -> None:
+        self.timers[name].append(seconds)
+        self.calls[name] += 1
+
+    def frame(self, bytes_written: int = 0) -> None:
+        """Count a frame written to the terminal."""
+        now = time.perf_counter()
+        self.frames.append((now, bytes_written))
+        self.total_frames += 1
+        self.total_bytes += bytes_written
+        while now - self.frames[0][0] > FPS_WINDOW:
+            self.frames.popleft()
+
+    def recent_frames(self) -> list[int]:
+        """Bytes of each frame written in the last FPS window."""
+        now = time.perf_counter()
+        return [size for frame, size in self.frames if now - frame <= FPS_WINDOW]
+
+    def fps(self) -> float:
+        return len(self.recent_frames()) / FPS_WINDOW
+
+    def bytes_per_frame(self) -> float:
+        """Mean size of the recent frames, or of all frames once the screen is idle."""
+        recent = self.recent_frames()
+        if recent:
+            return sum(recent) / len(recent)
+        return self.total_bytes / self.total_frames if self.total_frames else 0.0
+
+    def percentiles(self, name: str) -> tuple[float, float]:
+        """50th and 99th percentile of the recent samples, in milliseconds."""
+        samples = sorted(self.timers[name])
+        if not samples:
+            return 0.0, 0.0
+        p50 = samples[len(samples) // 2]
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return p50 * 1000, p99 * 1000
+
+    def report(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        timers = {}
+        for name in sorted(self.timers):
+            p50, p99 = self.percentiles(name)
+            timers[name] = {"calls": self.calls[name], "p50_ms": p50, "p99_ms": p99}
+        return {
+            "seconds": elapsed,
+            "frames": self.total_frames,
+            "mean_fps": self.total_frames / elapsed if elapsed else 0.0,
+            "bytes": self.total_bytes,
+            "mean_bytes_per_frame": (
+                self.total_bytes / self.total_frames if self.total_frames else 0.0
+            ),
+            "timers": timers,
+        }
+
+    def dump(self, profile_file: str) -> list[str]:
+        """Write the timers as JSON, and cProfile stats next to them if collected."""
+        written = [profile_file]
+        with open(profile_file, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        if self._cprofile is not None:
+            stats_file = profile_file.rsplit(".", 1)[0] + ".prof"
+            self._cprofile.dump_stats(stats_file)
+            written.append(stats_file)
+        logger.info("Profile written to %s", ", ".join(written))
+        return written
+
+
+profiler = Profiler()
+
+
+def profiled(name: str) -> Callable[[Callable], Callable]:
+    """Time every call of the function under the name while profiling is enabled."""
+
+    def decorator(function: Callable) -> Callable:
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if not profiler.enabled:
+                    return await function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    profiler.record(name, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
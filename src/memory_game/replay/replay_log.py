@@ -0,0 +1,246 @@
+"""Record every card flip of a game and play it back.
+
+Run with `memory-game replay --help` for the playback options.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from random import Random
+from typing import BinaryIO
+
+from memory_game.engine.game_engine import CardFlipped, GameEngine, GameEvent
+from memory_game.game_saver.game_save_manager import read_varint, write_varint
+
+logger = logging.getLogger(__name__)
+DEFAULT_REPLAY_FILE = "last_game.replay"
+
+# Replay layout: magic, version byte, kind byte, varint width and height, then either
+# the seed the cards were dealt with and the number of players, or a snapshot of a
+# loaded game (varints current player, turns, player count and scores, one byte per
+# card symbol, one byte per matched flag).
+# Every flip follows as two varints: card position and milliseconds since the
+# previous flip.
+REPLAY_MAGIC = b"MGRP"
+REPLAY_FORMAT_VERSION = 1
+DEALT_FROM_SEED = 0
+FROM_SNAPSHOT = 1
+
+
+@dataclass
+class Replay:
+    width: int
+    height: int
+    seed: int | None = None
+    symbols: bytes = b""
+    matched: bytes = b""
+    scores: tuple[int, ...] = (0, 0)
+    current_player: int = 1
+    turns: int = 0
+    flips: list[tuple[int, int]] = field(default_factory=list)  # (position, delay in ms)
+
+    def new_engine(self) -> GameEngine:
+        """Engine in the state the recording started from."""
+        if self.seed is not None:
+            return GameEngine.new_game(
+                self.width, self.height, Random(self.seed), len(self.scores)
+            )
+        return GameEngine(
+            self.width,
+            self.height,
+            self.symbols,
+            matched=self.matched,
+            scores=self.scores,
+            current_player=self.current_player,
+            turns=self.turns,
+        )
+
+
+def encode_header(engine: GameEngine, seed: int | None) -> bytes:
+    buffer = bytearray(REPLAY_MAGIC)
+    buffer.append(REPLAY_FORMAT_VERSION)
+    buffer.append(DEALT_FROM_SEED if seed is not None else FROM_SNAPSHOT)
+    write_varint(buffer, engine.width)
+    write_varint(buffer, engine.height)
+    if seed is not None:
+        write_varint(buffer, seed)
+        write_varint(buffer, engine.players)
+        return bytes(buffer)
+
+    for value in (engine.current_player, engine.turns, len(engine.scores), *engine.scores):
+        write_varint(buffer, value)
+    buffer += engine.symbols
+    buffer += engine.matched
+    return bytes(buffer)
+
+
+def read_replay(path: str) -> Replay:
+    """Read a replay file; a flip cut short by a crash at the end is ignored."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if data[: len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    offset = len(REPLAY_MAGIC)
+    version, kind = data[offset], data[offset + 1]
+    if version != REPLAY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported replay format version {version}")
+    offset += 2
+
+    width, offset = read_varint(data, offset)
+    height, offset = read_varint(data, offset)
+    replay = Replay(width, height)
+    if kind == DEALT_FROM_SEED:
+        replay.seed, offset = read_varint(data, offset)
+        players, offset = read_varint(data, offset)
+        replay.scores = (0,) * players
+    else:
+        replay.current_player, offset = read_varint(data, offset)
+        replay.turns, offset = read_varint(data, offset)
+        players, offset = read_varint(data, offset)
+        scores = []
+        for _ in range(players):
+            score, offset = read_varint(data, offset)
+            scores.append(score)
+        replay.scores = tuple(scores)
+        cards = width * height
+        replay.symbols = data[offset : offset + cards]
+        replay.matched = data[offset + cards : offset + 2 * cards]
+        offset += 2 * cards
+
+    while offset < len(data):
+        try:
+            position, offset = read_varint(data, offset)
+            delay, offset = read_varint(data, offset)
+        except IndexError:
+            logger.warning("Ignoring incomplete flip at the end of %s", path)
+            break
+        replay.flips.append((position, delay))
+    return replay
+
+
+class ReplayRecorder:
+    """Append-only log of the flips of one game.
+
+    The header is written when recording starts and each flip is appended as it
+    happens. Records are a few bytes, so they are flushed to the OS but not synced,
+    keeping the cost per flip negligible on the event loop.
+    """
+
+    def __init__(self, replay_file: str) -> None:
+        self.replay_file = replay_file
+        self.engine: GameEngine | None = None
+        self._file: BinaryIO | None = None
+        self._last_flip = 0.0
+
+    def start(self, engine: GameEngine, seed: int | None = None) -> None:
+        """Start a new recording of the engine, replacing the previous one."""
+        self.stop()
+        self._file = open(self.replay_file, "wb")
+        self._file.write(encode_header(engine, seed))
+        self._file.flush()
+        self._last_flip = time.monotonic()
+        self.engine = engine
+        engine.subscribe(self.on_game_event)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        if not isinstance(event, CardFlipped) or self._file is None:
+            return
+
+        now = time.monotonic()
+        buffer = bytearray()
+        write_varint(buffer, event.position)
+        write_varint(buffer, round((now - self._last_flip) * 1000))
+        self._last_flip = now
+        try:
+            self._file.write(buffer)
+            self._file.flush()
+        except OSError as e:
+            logger.error("Stopped recording replay: %s", e)
+            self.stop()
+
+    def stop(self) -> None:
+        if self.engine is not None:
+            self.engine.unsubscribe(self.on_game_event)
+            self.engine = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def fast_forward(engine: GameEngine, flips: list[tuple[int, int]]) -> None:
+    """Apply flips without any delay, hiding missed pairs as the next flip needs it."""
+    for position, _ in flips:
+        if engine.awaiting_resolve:
+            engine.resolve()
+        engine.flip(position)
+    engine.resolve()
+
+
+def turn_start(flips: int) -> int:
+    """Number of flips in complete turns, so playback never starts mid turn."""
+    return flips - flips % 2
+
+
+async def play_back(engine: GameEngine, flips: list[tuple[int, int]], speed: float) -> None:
+    """Apply flips with the recorded pauses, divided by speed."""
+    for position, delay in flips:
+        await asyncio.sleep(delay / 1000 / speed)
+        if engine.awaiting_resolve:
+            engine.resolve()
+        engine.flip(position)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="memory-game replay", description="Play back a recorded game"
+    )
+    parser.add_argument(
+        "replay_file", nargs="?", default=DEFAULT_REPLAY_FILE, help="Recorded game"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="Playback speed, 1 is the recorded speed"
+    )
+    parser.add_argument(
+        "--start",
+        type=int,
+        default=0,
+        help="Fast-forward this many flips before showing the board",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Fast-forward the whole game without the UI and print the result",
+    )
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("Speed must be positive")
+
+    if args.headless:
+        replay = read_replay(args.replay_file)
+        engine = replay.new_engine()
+        start = time.perf_counter()
+        fast_forward(engine, replay.flips)
+        elapsed = time.perf_counter() - start
+        print(f"Board: {replay.width}x{replay.height}, flips: {len(replay.flips)}")
+        print(f"Turns: {engine.turns}, scores: {engine.scores}, over: {engine.is_over}")
+        print(f"Replayed in {elapsed * 1000:.2f} ms")
+        return
+
+    from memory_game.app import MemoryApp
+    from memory_game.config import configure_logger
+
+    configure_logger()
+    config = {
+        "replay_file": args.replay_file,
+        "replay": "true",
+        "replay_speed": str(args.speed),
+        "replay_start": str(args.start),
+    }
+    MemoryApp(config=config).run()
+
+
+if __name__ == "__main__":
+    main()
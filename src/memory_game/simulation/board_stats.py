@@ -0,0 +1,199 @@
+"""Expected game length and first player advantage for each board size.
+
+Both players have perfect memory (the "hard" computer player). Games are played
+many at once as NumPy arrays when NumPy is installed (`pip install .[analysis]`),
+otherwise one by one with the game engine.
+
+Run with `memory-game analyze --help` for the available options.
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from random import Random
+
+from memory_game.engine.game_engine import MAX_BOARD_SIZE, MIN_BOARD_SIZE
+from memory_game.simulation.simulator import play_game
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BATCH_SIZE = 100_000
+BACKENDS = ("numpy", "python")
+
+
+@dataclass
+class BoardStats:
+    width: int
+    height: int
+    games: int
+    mean_turns: float
+    first_wins: float
+    second_wins: float
+    draws: float
+
+    @property
+    def first_player_advantage(self) -> float:
+        return self.first_wins - self.second_wins
+
+
+def _play_batch(pairs: int, games: int, rng: "np.random.Generator") -> tuple:
+    """Play a batch of games to the end, returning turns and final scores arrays.
+
+    The deck is a uniformly shuffled permutation and players know only what they
+    have seen, so flipping unseen cards left to right is the same as flipping a
+    random unseen card: each game only keeps the position of its next unseen card.
+    """
+    symbol_type = np.int8 if pairs <= np.iinfo(np.int8).max else np.int16
+    deck = np.arange(pairs, dtype=symbol_type).repeat(2)
+    decks = rng.permuted(np.broadcast_to(deck, (games, deck.size)), axis=1)
+
+    seen = np.zeros((games, pairs), dtype=bool)  # symbols with a card already revealed
+    known_pairs = np.zeros(games, dtype=np.int16)  # pairs with both cards revealed
+    next_unseen = np.zeros(games, dtype=np.intp)
+    remaining = np.full(games, pairs, dtype=np.int16)
+    scores = np.zeros((games, 2), dtype=np.int16)
+    player = np.zeros(games, dtype=np.intp)
+    turns = np.zeros(games, dtype=np.int32)
+    last = deck.size - 1
+
+    while True:
+        playing = np.flatnonzero(remaining)
+        if not playing.size:
+            break
+
+        take_known = known_pairs[playing] > 0
+        explore = playing[~take_known]
+        first = decks[explore, next_unseen[explore]]
+        partner_seen = seen[explore, first]
+        seen[explore, first] = True
+
+        second = decks[explore, np.minimum(next_unseen[explore] + 1, last)]
+        flips_second = ~partner_seen
+        second_matches = flips_second & (second == first)
+        second_known = flips_second & ~second_matches & seen[explore, second]
+        seen[explore[flips_second], second[flips_second]] = True
+        next_unseen[explore] += 1 + flips_second
+        known_pairs[explore] += second_known
+        known_pairs[playing[take_known]] -= 1
+
+        matched = take_known.copy()
+        matched[~take_known] = partner_seen | second_matches
+        scorers = playing[matched]
+        scores[scorers, player[scorers]] += 1
+        remaining[scorers] -= 1
+        player[playing[~matched]] ^= 1
+        turns[playing] += 1
+
+    return turns, scores
+
+
+def board_stats_numpy(width: int, height: int, games: int, seed: int = 0) -> BoardStats:
+    rng = np.random.default_rng(seed)
+    pairs = width * height // 2
+    total_turns = first_wins = second_wins = 0
+    for start in range(0, games, BATCH_SIZE):
+        turns, scores = _play_batch(pairs, min(BATCH_SIZE, games - start), rng)
+        total_turns += int(turns.sum())
+        first_wins += int(np.count_nonzero(scores[:, 0] > scores[:, 1]))
+        second_wins += int(np.count_nonzero(scores[:, 0] < scores[:, 1]))
+    return BoardStats(
+        width,
+        height,
+        games,
+        total_turns / games,
+        first_wins / games,
+        second_wins / games,
+        (games - first_wins - second_wins) / games,
+    )
+
+
+def board_stats_python(width: int, height: int, games: int, seed: int = 0) -> BoardStats:
+    rng = Random(seed)
+    total_turns = first_wins = second_wins = 0
+    for _ in range(games):
+        (first, second), turns = play_game(width, height, rng, ["hard", "hard"])
+        total_turns += turns
+        first_wins += first > second
+        second_wins += first < second
+    return BoardStats(
+        width,
+        height,
+        games,
+        total_turns / games,
+        first_wins / games,
+        second_wins / games,
+        (games - first_wins - second_wins) / games,
+    )
+
+
+def board_stats(
+    width: int, height: int, games: int, seed: int = 0, backend: str | None = None
+) -> BoardStats:
+    """Statistics for one board size, with NumPy unless another backend is given."""
+    if backend is None:
+        backend = "numpy" if np is not None else "python"
+    if backend == "numpy":
+        if np is None:
+            raise RuntimeError("NumPy is not installed, install the game with the analysis extra")
+        return board_stats_numpy(width, height, games, seed)
+    return board_stats_python(width, height, games, seed)
+
+
+def board_sizes(min_size: int, max_size: int) -> list[tuple[int, int]]:
+    """Every width x height in the range with an even number of cards."""
+    return [
+        (width, height)
+        for width in range(min_size, max_size + 1)
+        for height in range(min_size, max_size + 1)
+        if (width * height) % 2 == 0
+    ]
+
+
+def format_stats(stats: BoardStats) -> str:
+    return (
+        f"{stats.width:>3}x{stats.height:<3} {stats.mean_turns:>9.2f} "
+        f"{stats.first_wins:>8.1%} {stats.second_wins:>8.1%} {stats.draws:>7.1%} "
+        f"{stats.first_player_advantage:>+10.1%}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="memory-game analyze",
+        description="Expected game length and first player advantage for each board size",
+    )
+    parser.add_argument(
+        "-n", "--games", type=int, default=100_000, help="Number of games per board size"
+    )
+    parser.add_argument(
+        "--min-size", type=int, default=MIN_BOARD_SIZE, help="Smallest width and height"
+    )
+    parser.add_argument("--max-size", type=int, default=6, help="Largest width and height")
+    parser.add_argument(
+        "--backend", choices=BACKENDS, default=None, help="Default: numpy if it is installed"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for reproducible runs")
+    args = parser.parse_args(argv)
+
+    if args.games < 1:
+        parser.error("At least one game per board size is needed")
+    if not MIN_BOARD_SIZE <= args.min_size <= args.max_size <= MAX_BOARD_SIZE:
+        parser.error(
+            f"Board sizes must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}, "
+            "--min-size at most --max-size"
+        )
+
+    print(f"{'board':<7} {'turns':>9} {'p1 wins':>8} {'p2 wins':>8} {'draws':>7} {'advantage':>10}")
+    start = time.perf_counter()
+    sizes = board_sizes(args.min_size, args.max_size)
+    for width, height in sizes:
+        print(format_stats(board_stats(width, height, args.games, args.seed, args.backend)))
+    elapsed = time.perf_counter() - start
+    print(f"{len(sizes) * args.games} games in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Headless self-play of many games across a process pool.
+
+Run with `memory-game simulate --help` for the available options.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from random import Random
+from typing import Callable, Protocol
+
+from memory_game.ai.computer_player import DIFFICULTIES, ComputerPlayer
+from memory_game.engine.game_engine import (
+    MAX_BOARD_SIZE,
+    MAX_PLAYERS,
+    MIN_BOARD_SIZE,
+    MIN_PLAYERS,
+    GameEngine,
+    GameEvent,
+    PairMatched,
+)
+
+logger = logging.getLogger(__name__)
+CHUNK_SIZE = 250
+HISTOGRAM_WIDTH = 40
+HISTOGRAM_ROWS = 20
+
+
+class Player(Protocol):
+    def choose_card(self) -> int:
+        """Position of the next card to flip."""
+        ...
+
+
+PlayerFactory = Callable[[GameEngine, Random], Player]
+
+
+class RandomPlayer:
+    """Flips random cards that are still on the board, remembering nothing."""
+
+    def __init__(self, engine: GameEngine, rng: Random) -> None:
+        self.engine = engine
+        self.rng = rng
+        self.unmatched = list(range(len(engine.symbols)))
+        engine.subscribe(self.on_game_event)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        if isinstance(event, PairMatched):
+            self.unmatched.remove(event.first)
+            self.unmatched.remove(event.second)
+
+    def choose_card(self) -> int:
+        while True:
+            position = self.rng.choice(self.unmatched)
+            if position not in self.engine.flipped:
+                return position
+
+
+PLAYER_TYPES: dict[str, PlayerFactory] = {
+    "random": RandomPlayer,
+    **{
+        difficulty: partial(ComputerPlayer, memory_size=memory_size)
+        for difficulty, memory_size in DIFFICULTIES.items()
+    },
+}
+
+
+def play_game(
+    width: int, height: int, rng: Random, player_types: list[str]
+) -> tuple[tuple[int, ...], int]:
+    """Play one game, returning final scores and the number of turns."""
+    engine = GameEngine.new_game(width, height, rng, len(player_types))
+    players = [PLAYER_TYPES[player_type](engine, rng) for player_type in player_types]
+    while not engine.is_over:
+        player = players[engine.current_player - 1]
+        engine.flip(player.choose_card())
+        engine.flip(player.choose_card())
+        engine.resolve()
+    return tuple(engine.scores), engine.turns
+
+
+@dataclass
+class SimulationResult:
+    games: int = 0
+    wins: Counter = field(default_factory=Counter)  # winning player, 0 for a draw
+    scores: list[Counter] = field(default_factory=list)  # score counts of each player
+    turns: Counter = field(default_factory=Counter)
+
+    def add_game(self, scores: tuple[int, ...], turns: int) -> None:
+        self.games += 1
+        best = max(scores)
+        winners = [player for player, score in enumerate(scores, start=1) if score == best]
+        self.wins[winners[0] if len(winners) == 1 else 0] += 1
+        self.add_players(len(scores))
+        for player_scores, score in zip(self.scores, scores):
+            player_scores[score] += 1
+        self.turns[turns] += 1
+
+    def add_players(self, players: int) -> None:
+        self.scores.extend(Counter() for _ in range(players - len(self.scores)))
+
+    def merge(self, other: "SimulationResult") -> None:
+        self.games += other.games
+        self.wins.update(other.wins)
+        self.add_players(len(other.scores))
+        for player_scores, other_scores in zip(self.scores, other.scores):
+            player_scores.update(other_scores)
+        self.turns.update(other.turns)
+
+
+def run_chunk(
+    width: int, height: int, games: int, seed: int, player_types: list[str]
+) -> SimulationResult:
+    """Play a chunk of games with its own RNG, so results do not depend on worker count."""
+    rng = Random(seed)
+    result = SimulationResult()
+    for _ in range(games):
+        result.add_game(*play_game(width, height, rng, player_types))
+    return result
+
+
+def _run_chunk(args: tuple) -> SimulationResult:
+    return run_chunk(*args)
+
+
+def simulate(
+    games: int,
+    width: int,
+    height: int,
+    player_types: list[str],
+    workers: int | None = None,
+    seed: int = 0,
+) -> SimulationResult:
+    chunks = [
+        (width, height, min(CHUNK_SIZE, games - start), seed * 1_000_003 + index, player_types)
+        for index, start in enumerate(range(0, games, CHUNK_SIZE))
+    ]
+    result = SimulationResult()
+    with multiprocessing.Pool(workers) as pool:
+        for chunk_result in pool.imap_unordered(_run_chunk, chunks):
+            result.merge(chunk_result)
+    return result
+
+
+def format_histogram(counter: Counter, label: str) -> list[str]:
+    """Text histogram, values are grouped into at most HISTOGRAM_ROWS buckets."""
+    low, high = min(counter), max(counter)
+    bucket_size = -(-(high - low + 1) // HISTOGRAM_ROWS)
+    buckets = Counter()
+    for value, count in counter.items():
+        buckets[(value - low) // bucket_size] += count
+
+    peak = max(buckets.values())
+    lines = []
+    for bucket in range(max(buckets) + 1):
+        start = low + bucket * bucket_size
+        values = f"{start}" if bucket_size == 1 else f"{start}-{start + bucket_size - 1}"
+        bar = "#" * round(buckets[bucket] / peak * HISTOGRAM_WIDTH)
+        lines.append(f"  {label} {values:>9} | {bar} {buckets[bucket]}")
+    return lines
+
+
+def format_report(result: SimulationResult, elapsed: float) -> str:
+    win_rates = [
+        f"player {player} {result.wins[player] / result.games:.1%}"
+        for player in range(1, len(result.scores) + 1)
+    ]
+    lines = [
+        f"Games: {result.games} in {elapsed:.2f}s ({result.games / elapsed:.0f} games/s)",
+        f"Wins: {', '.join(win_rates)}, draw {result.wins[0] / result.games:.1%}",
+    ]
+    for player, player_scores in enumerate(result.scores, start=1):
+        mean = sum(score * count for score, count in player_scores.items()) / result.games
+        lines.append(f"Player {player} score distribution (mean {mean:.2f}):")
+        lines.extend(format_histogram(player_scores, "score"))
+
+    mean_turns = sum(turns * count for turns, count in result.turns.items()) / result.games
+    lines.append(f"Game length in turns (mean {mean_turns:.2f}):")
+    lines.extend(format_histogram(result.turns, "turns"))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="memory-game simulate", description="Play many games without the UI"
+    )
+    parser.add_argument("-n", "--games", type=int, default=10_000, help="Number of games")
+    parser.add_argument("--width", type=int, default=6, help="Board width")
+    parser.add_argument("--height", type=int, default=6, help="Board height")
+    parser.add_argument(
+        "--players",
+        nargs="+",
+        choices=sorted(PLAYER_TYPES),
+        default=["random", "random"],
+        help=f"Type of each player, {MIN_PLAYERS} to {MAX_PLAYERS} players",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for reproducible runs")
+    args = parser.parse_args(argv)
+
+    if args.games < 1:
+        parser.error("At least one game is needed")
+    if not (
+        MIN_BOARD_SIZE <= args.width <= MAX_BOARD_SIZE
+        and MIN_BOARD_SIZE <= args.height <= MAX_BOARD_SIZE
+    ):
+        parser.error(f"Board size must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}")
+    if not MIN_PLAYERS <= len(args.players) <= MAX_PLAYERS:
+        parser.error(f"Between {MIN_PLAYERS} and {MAX_PLAYERS} players are needed")
+    if (args.width * args.height) % 2:
+        parser.error("Board size must be an even number")
+
+    start = time.perf_counter()
+    result = simulate(args.games, args.width, args.height, args.players, args.workers, args.seed)
+    print(format_report(result, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Static
+
+from memory_game.stats.stats_store import BoardTotals, GameResult, StatsStore
+
+logger = logging.getLogger(__name__)
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def winner_label(game: GameResult) -> str:
+    if game.winner is None:
+        return "Draw"
+    return f"Player {game.winner} ({game.player_types[game.winner - 1]})"
+
+
+class LeaderboardScreen(ModalScreen[None]):
+    """Totals of every board size played and the best games of the highlighted one.
+
+    The screen opens right away, the stats are read in worker threads.
+    """
+
+    CSS_PATH = Path(__file__).parent.parent / "styles" / "leaderboard_screen.tcss"
+    BINDINGS = [("escape", "close", "Close")]
+
+    def __init__(self, stats_store: StatsStore, board: tuple[int, int] | None = None) -> None:
+        super().__init__()
+        self.stats_store = stats_store
+        self.board = board
+        self.totals: list[BoardTotals] = []
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static("Leaderboard", id="title"),
+            DataTable(id="boards-table", cursor_type="row", zebra_stripes=True),
+            Static("", id="games-title"),
+            DataTable(id="games-table", cursor_type="none", zebra_stripes=True),
+            Button("Close", variant="error", id="close-button"),
+            id="leaderboard-container",
+        )
+
+    def on_mount(self) -> None:
+        self.query_one("#boards-table", DataTable).add_columns(
+            "Board", "Games", "Draws", "Avg turns", "Best turns", "Avg time", "Best time"
+        )
+        self.query_one("#games-table", DataTable).add_columns(
+            "#", "Turns", "Time", "Winner", "Scores", "Played"
+        )
+        self.load_totals()
+
+    @work(exclusive=True, group="board-totals")
+    async def load_totals(self) -> None:
+        try:
+            self.totals = await asyncio.to_thread(self.stats_store.board_totals)
+        except sqlite3.Error as e:
+            logger.error("Could not read stats from %s: %s", self.stats_store.stats_file, e)
+            self.query_one("#title", Static).update("Leaderboard - stats cannot be read")
+            return
+        if not self.totals:
+            self.query_one("#title", Static).update("Leaderboard - no finished games yet")
+            return
+
+        table = self.query_one("#boards-table", DataTable)
+        table.add_rows(
+            [
+                (
+                    f"{board.width}x{board.height}",
+                    board.games,
+                    board.draws,
+                    f"{board.average_turns:.1f}",
+                    board.best_turns,
+                    format_duration(board.average_duration),
+                    format_duration(board.best_duration),
+                )
+                for board in self.totals
+            ]
+        )
+        boards = [(board.width, board.height) for board in self.totals]
+        row = boards.index(self.board) if self.board in boards else 0
+        table.move_cursor(row=row)
+        table.focus()
+        self.load_games(self.totals[row])
+
+    @on(DataTable.RowHighlighted, "#boards-table")
+    def select_board(self, event: DataTable.RowHighlighted) -> None:
+        self.load_games(self.totals[event.cursor_row])
+
+    @work(exclusive=True, group="leaderboard-games")
+    async def load_games(self, board: BoardTotals) -> None:
+        try:
+            games = await asyncio.to_thread(
+                self.stats_store.leaderboard, board.width, board.height
+            )
+        except sqlite3.Error as e:
+            logger.error("Could not read leaderboard: %s", e)
+            return
+
+        self.query_one("#games-title", Static).update(
+            f"Best {board.width}x{board.height} games: fewest turns, then shortest time"
+        )
+        table = self.query_one("#games-table", DataTable)
+        table.clear()
+        table.add_rows(
+            [
+                (
+                    rank,
+                    game.turns,
+                    format_duration(game.duration),
+                    winner_label(game),
+                    " : ".join(str(score) for score in game.scores),
+                    datetime.fromtimestamp(game.finished_at).strftime("%Y-%m-%d %H:%M"),
+                )
+                for rank, game in enumerate(games, start=1)
+            ]
+        )
+
+    @on(Button.Pressed, "#close-button")
+    def action_close(self) -> None:
+        self.dismiss(None)
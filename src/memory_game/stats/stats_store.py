@@ -0,0 +1,270 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+DEFAULT_STATS_FILE = "memory_game_stats.db"
+# most games written in one transaction
+BATCH_SIZE = 500
+LEADERBOARD_SIZE = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    winner INTEGER,
+    scores TEXT NOT NULL,
+    player_types TEXT NOT NULL
+);
+-- leaderboard of a board size: an index range read in rank order, LIMIT rows only
+CREATE INDEX IF NOT EXISTS games_by_board_rank ON games (width, height, turns, duration);
+-- totals of each board size, updated with every batch, so no query scans the games
+CREATE TABLE IF NOT EXISTS board_totals (
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    total_turns INTEGER NOT NULL,
+    best_turns INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    best_duration REAL NOT NULL,
+    PRIMARY KEY (width, height)
+) WITHOUT ROWID;
+"""
+
+INSERT_GAME = """
+INSERT INTO games (finished_at, width, height, turns, duration, winner, scores, player_types)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+UPDATE_TOTALS = """
+INSERT INTO board_totals
+    (width, height, games, draws, total_turns, best_turns, total_duration, best_duration)
+VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+ON CONFLICT (width, height) DO UPDATE SET
+    games = games + 1,
+    draws = draws + excluded.draws,
+    total_turns = total_turns + excluded.total_turns,
+    best_turns = min(best_turns, excluded.best_turns),
+    total_duration = total_duration + excluded.total_duration,
+    best_duration = min(best_duration, excluded.best_duration)
+"""
+
+
+@dataclass
+class GameResult:
+    """A finished game, as recorded in the stats store."""
+
+    width: int
+    height: int
+    scores: list[int]  # score of player N at index N - 1
+    turns: int
+    duration: float  # seconds played since the game was dealt or loaded
+    winner: int | None  # None for a draw
+    player_types: list[str]  # human, a computer difficulty or remote, per player
+    finished_at: float = 0.0
+
+
+@dataclass
+class BoardTotals:
+    width: int
+    height: int
+    games: int
+    draws: int
+    average_turns: float
+    best_turns: int
+    average_duration: float
+    best_duration: float
+
+
+class StatsStore:
+    """Finished games in a local SQLite database.
+
+    Games are queued by the UI and written by one background thread. It writes all
+    games queued while the previous transaction committed in one transaction, so a
+    single game is written right away and bursts are batched. Reads open their own
+    connection and only touch an index range or the per board totals, so they take
+    the same time however many games were recorded.
+    """
+
+    def __init__(self, stats_file: str) -> None:
+        stats_file = stats_file if stats_file else DEFAULT_STATS_FILE
+        self.stats_file = os.path.abspath(stats_file)
+        self._queue: queue.SimpleQueue[GameResult | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        # set when the database cannot be opened, later games are dropped
+        self._disabled = False
+
+    def connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.stats_file)
+        try:
+            # readers do not wait for the writer, and commits skip the fsync of every batch
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            with self._lock:
+                if not self._schema_ready:
+                    connection.executescript(SCHEMA)
+                    self._schema_ready = True
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def record(self, result: GameResult) -> None:
+        """Queue a finished game, it is written by the background thread."""
+        if not result.finished_at:
+            result.finished_at = time.time()
+        with self._lock:
+            if self._disabled:
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_batches, name="stats-writer", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.close)
+        self._queue.put(result)
+
+    def close(self) -> None:
+        """Write the queued games and stop the background thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    def _write_batches(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
+            connection = self.connect()
+        except (OSError, sqlite3.Error) as e:
+            logger.error(
+                "Could not open stats database %s, games are not recorded: %s",
+                self.stats_file,
+                e,
+            )
+            with self._lock:
+                self._disabled = True
+                self._writer = None
+            return
+
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self._queue.get()]
+                while len(batch) < BATCH_SIZE and batch[-1] is not None:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stopping = batch[-1] is None
+                games = [result for result in batch if result is not None]
+                if games:
+                    self.write(connection, games)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def write(connection: sqlite3.Connection, games: list[GameResult]) -> None:
+        try:
+            with connection:
+                connection.executemany(
+                    INSERT_GAME,
+                    [
+                        (
+                            game.finished_at,
+                            game.width,
+                            game.height,
+                            game.turns,
+                            game.duration,
+                            game.winner,
+                            json.dumps(game.scores),
+                            json.dumps(game.player_types),
+                        )
+                        for game in games
+                    ],
+                )
+                connection.executemany(
+                    UPDATE_TOTALS,
+                    [
+                        (
+                            game.width,
+                            game.height,
+                            int(game.winner is None),
+                            game.turns,
+                            game.turns,
+                            game.duration,
+                            game.duration,
+                        )
+                        for game in games
+                    ],
+                )
+        except sqlite3.Error as e:
+            logger.error("Could not record %d games: %s", len(games), e)
+            return
+        logger.debug("Recorded %d games", len(games))
+
+    def board_totals(self) -> list[BoardTotals]:
+        """Totals of every board size played, the most played first."""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT width, height, games, draws, total_turns, best_turns,"
+                " total_duration, best_duration FROM board_totals"
+                " ORDER BY games DESC, width, height"
+            ).fetchall()
+        finally:
+            connection.close()
+        return [
+            BoardTotals(
+                width=width,
+                height=height,
+                games=games,
+                draws=draws,
+                average_turns=total_turns / games,
+                best_turns=best_turns,
+                average_duration=total_duration / games,
+                best_duration=best_duration,
+            )
+            for width, height, games, draws, total_turns, best_turns, total_duration, best_duration
+            in rows
+        ]
+
+    def leaderboard(
+        self, width: int, height: int, limit: int = LEADERBOARD_SIZE
+    ) -> list[GameResult]:
+        """Best games of a board size: the fewest turns, then the shortest time."""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT width, height, scores, turns, duration, winner, player_types,"
+                " finished_at FROM games WHERE width = ? AND height = ?"
+                " ORDER BY turns, duration LIMIT ?",
+                (width, height, limit),
+            ).fetchall()
+        finally:
+            connection.close()
+        return [
+            GameResult(
+                width=width,
+                height=height,
+                scores=json.loads(scores),
+                turns=turns,
+                duration=duration,
+                winner=winner,
+                player_types=json.loads(player_types),
+                finished_at=finished_at,
+            )
+            for width, height, scores, turns, duration, winner, player_types, finished_at in rows
+        ]